@@ -1,78 +1,244 @@
 import os
+import logging
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple
 from dotenv import load_dotenv
 
-# .env 파일 로드
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-class Config:
-    """전역 설정 관리"""
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_OUTPUT_DIR = os.path.join(_BASE_DIR, "outputs")
+
+# 폰트 후보 (앞에서부터 먼저 존재하는 파일 사용, 환경 변수가 최우선)
+_FONT_CANDIDATES = (
+    r"C:\Windows\Fonts\NanumSquareR.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumSquareR.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/Library/Fonts/NanumSquareR.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    os.path.join(_BASE_DIR, "assets", "fonts", "NanumSquareR.ttf"),
+)
+_FONT_TOP_CANDIDATES = (
+    r"C:\Windows\Fonts\H2HDRM.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumSquareEB.ttf",
+    "/usr/share/fonts/truetype/nanum/NanumGothicExtraBold.ttf",
+    "/Library/Fonts/NanumSquareEB.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    os.path.join(_BASE_DIR, "assets", "fonts", "H2HDRM.ttf"),
+)
+
+
+def _resolve_font(env_name: str, candidates: Tuple[str, ...]) -> str:
+    """환경 변수 -> 후보 순서로 존재하는 폰트 경로 (없으면 첫 후보, validate()에서 오류)"""
+    for path in (os.getenv(env_name),) + candidates:
+        if path and os.path.isfile(path):
+            return path
+    return os.getenv(env_name) or candidates[0]
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """전역 설정 관리 (불변, get_config()로 프로세스당 한 번 생성)"""
     
     # API Keys
-    KINDS_ACCESS_KEY = os.getenv("KINDS_ACCESS_KEY", "")
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-    GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "")
-    HUGGINGFACE_TOKEN = os.getenv("HUGGINGFACE_TOKEN", "")
+    KINDS_ACCESS_KEY: str = ""
+    OPENAI_API_KEY: str = ""
+    GOOGLE_APPLICATION_CREDENTIALS: str = ""
+    HUGGINGFACE_TOKEN: str = ""
     
     # 뉴스 수집 설정
-    ISSUE_PROVIDERS_FILTER = [
+    ISSUE_PROVIDERS_FILTER: FrozenSet[str] = frozenset({
         "MBC", "KBS", "SBS", "국민일보",
         "조선일보", "중앙일보", "동아일보",
         "한겨레", "경향신문",
-    ]
+    })
     
     # 크롤링 설정
-    MIN_REASONABLE_LEN = 800
-    MIN_KINDS_LEN_TO_SAVE_IF_NO_FALLBACK = 500
+    MIN_REASONABLE_LEN: int = 800
+    MIN_KINDS_LEN_TO_SAVE_IF_NO_FALLBACK: int = 500
+    CRAWL_WORKERS: int = 8  # KINDS 상세 조회/원문 크롤링 동시 처리 개수
     
     # 요약 설정
-    SUMMARY_PARTS = 4
-    SUMMARY_MODEL = "lcw99/t5-base-korean-text-summary"
+    SUMMARY_PARTS: int = 4
+    SUMMARY_MODEL: str = "lcw99/t5-base-korean-text-summary"
+    SUMMARY_NUM_BEAMS: int = 1  # 1이면 greedy 디코딩 (품질이 부족하면 2)
+    SUMMARY_BATCH_SIZE: int = 16  # 요약 generate 1회에 넣는 본문 조각 최대 개수
     
     # 이미지 생성 설정
-    IMAGE_SIZE = "1024x1024"
-    IMAGE_QUALITY = "standard"  # standard or hd
+    IMAGE_SIZE: str = "1024x1024"
+    IMAGE_QUALITY: str = "standard"  # standard or hd
     
     # TTS 설정
-    TTS_VOICE_NAME = "ko-KR-Chirp3-HD-Zephyr"
-    TTS_LANGUAGE_CODE = "ko-KR"
-    TTS_SPEAKING_RATE = 1.0
-    TTS_PITCH = 0.0
+    TTS_VOICE_NAME: str = "ko-KR-Chirp3-HD-Zephyr"
+    TTS_LANGUAGE_CODE: str = "ko-KR"
+    TTS_SPEAKING_RATE: float = 1.0
+    TTS_PITCH: float = 0.0
     
     # 영상 설정
-    VIDEO_WIDTH = 720
-    VIDEO_HEIGHT = 1280
-    VIDEO_FPS = 24
-    FONT_PATH = r"C:\Windows\Fonts\NanumSquareR.ttf"
-    FONT_TOP_PATH = r"C:\Windows\Fonts\H2HDRM.ttf"
+    VIDEO_WIDTH: int = 720
+    VIDEO_HEIGHT: int = 1280
+    VIDEO_FPS: int = 24
+    VIDEO_PRESET: str = "veryfast"  # libx264 프리셋 (초안은 ultrafast)
+    FONT_PATH: str = _FONT_CANDIDATES[0]
+    FONT_TOP_PATH: str = _FONT_TOP_CANDIDATES[0]
+    
+    # 병렬 처리 설정
+    PIPELINE_WORKERS: int = 4  # 이미지/TTS 동시 처리 개수
+    TTS_WORKERS: int = 16  # TTS 합성 동시 요청 수 (전체 기사 공유)
+    VIDEO_WORKERS: int = max(1, (os.cpu_count() or 2) // 2)  # 영상 인코딩 프로세스 수 (libx264 자체도 멀티스레드)
     
     # 디렉토리
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    OUTPUT_DIR = os.path.join(BASE_DIR, "outputs")
-    ARTICLES_DIR = os.path.join(OUTPUT_DIR, "articles")
-    IMAGES_DIR = os.path.join(OUTPUT_DIR, "images")
-    TTS_DIR = os.path.join(OUTPUT_DIR, "tts")
-    VIDEOS_DIR = os.path.join(OUTPUT_DIR, "videos")
+    BASE_DIR: str = _BASE_DIR
+    OUTPUT_DIR: str = _OUTPUT_DIR
+    ARTICLES_DIR: str = os.path.join(_OUTPUT_DIR, "articles")
+    IMAGES_DIR: str = os.path.join(_OUTPUT_DIR, "images")
+    TTS_DIR: str = os.path.join(_OUTPUT_DIR, "tts")
+    VIDEOS_DIR: str = os.path.join(_OUTPUT_DIR, "videos")
+    CACHE_DIR: str = os.path.join(_OUTPUT_DIR, "cache")
     
-    @classmethod
-    def create_directories(cls):
-        """필요한 디렉토리 생성"""
-        for dir_path in [cls.OUTPUT_DIR, cls.ARTICLES_DIR, 
-                         cls.IMAGES_DIR, cls.TTS_DIR, cls.VIDEOS_DIR]:
-            os.makedirs(dir_path, exist_ok=True)
+    def create_directories(self):
+        """필요한 디렉토리 생성 (OUTPUT_DIR 하위는 디렉토리 fd 기준으로 생성)"""
+        os.makedirs(self.OUTPUT_DIR, exist_ok=True)
+        subdirs = [self.ARTICLES_DIR, self.IMAGES_DIR, self.TTS_DIR,
+                   self.VIDEOS_DIR, self.CACHE_DIR]
+        
+        if os.mkdir not in os.supports_dir_fd:
+            # Windows: dir_fd 미지원
+            for dir_path in subdirs:
+                os.makedirs(dir_path, exist_ok=True)
+            return
+        
+        out_fd = os.open(self.OUTPUT_DIR, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            for dir_path in subdirs:
+                if os.path.dirname(dir_path) != self.OUTPUT_DIR:
+                    os.makedirs(dir_path, exist_ok=True)
+                    continue
+                try:
+                    os.mkdir(os.path.basename(dir_path), dir_fd=out_fd)
+                except FileExistsError:
+                    pass
+        finally:
+            os.close(out_fd)
     
-    @classmethod
-    def validate(cls):
-        """필수 설정 검증"""
+    def validate(self, check_runtime: bool = True):
+        """
+        필수 설정 검증
+        
+        Args:
+            check_runtime: 파일 경로, ffmpeg, OpenAI 키까지 사전 점검
+                (파이프라인 후반 단계에서 실패하지 않도록 시작 전에 확인)
+        """
         errors = []
         
-        if not cls.KINDS_ACCESS_KEY:
+        if not self.KINDS_ACCESS_KEY:
             errors.append("KINDS_ACCESS_KEY가 설정되지 않았습니다.")
-        if not cls.OPENAI_API_KEY:
+        if not self.OPENAI_API_KEY:
             errors.append("OPENAI_API_KEY가 설정되지 않았습니다.")
-        if not cls.GOOGLE_APPLICATION_CREDENTIALS:
+        if not self.GOOGLE_APPLICATION_CREDENTIALS:
             errors.append("GOOGLE_APPLICATION_CREDENTIALS가 설정되지 않았습니다.")
-            
+        
+        if check_runtime:
+            errors.extend(self._check_runtime(skip_openai=not self.OPENAI_API_KEY))
+        
         if errors:
             raise ValueError("설정 오류:\n" + "\n".join(f"- {e}" for e in errors))
         
         return True
+    
+    def _check_runtime(self, skip_openai: bool = False):
+        """실행 환경 점검 (오류 메시지 리스트 반환)"""
+        errors = []
+        
+        if self.GOOGLE_APPLICATION_CREDENTIALS and not os.path.isfile(self.GOOGLE_APPLICATION_CREDENTIALS):
+            errors.append(f"GOOGLE_APPLICATION_CREDENTIALS 파일이 없습니다: {self.GOOGLE_APPLICATION_CREDENTIALS}")
+        
+        for name, env_name, path in (("FONT_PATH", "SHORTKINDS_FONT", self.FONT_PATH),
+                                     ("FONT_TOP_PATH", "SHORTKINDS_TOP_FONT", self.FONT_TOP_PATH)):
+            if not os.path.isfile(path):
+                errors.append(f"{name} 폰트 파일이 없습니다: {path} ({env_name} 환경 변수로 지정 가능)")
+        
+        if not _find_ffmpeg():
+            errors.append("ffmpeg를 찾을 수 없습니다. (PATH 또는 imageio-ffmpeg 설치 필요)")
+        
+        if not skip_openai:
+            error = _probe_openai(self.OPENAI_API_KEY)
+            if error:
+                errors.append(error)
+        
+        return errors
+
+
+def _find_ffmpeg():
+    """ffmpeg 실행 파일 경로 (MoviePy가 쓰는 imageio-ffmpeg 번들 포함)"""
+    path = shutil.which("ffmpeg")
+    if path:
+        return path
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return None
+
+
+def _probe_openai(api_key: str, timeout: float = 2.0):
+    """OpenAI 키 점검 (인증 실패만 오류로 처리, 네트워크 문제는 경고)"""
+    try:
+        import openai
+        client = openai.OpenAI(api_key=api_key, timeout=timeout, max_retries=0)
+        client.models.list()
+    except ImportError:
+        return None
+    except Exception as e:
+        if type(e).__name__ in ("AuthenticationError", "PermissionDeniedError"):
+            return f"OPENAI_API_KEY 인증 실패: {e}"
+        logger.warning(f"⚠️ OpenAI 연결 확인 실패 (계속 진행): {e}")
+    return None
+
+
+_installed: Optional[AppConfig] = None
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> AppConfig:
+    """.env 파일을 한 번만 읽어 설정 생성"""
+    load_dotenv()
+    return AppConfig(
+        KINDS_ACCESS_KEY=os.getenv("KINDS_ACCESS_KEY", ""),
+        OPENAI_API_KEY=os.getenv("OPENAI_API_KEY", ""),
+        GOOGLE_APPLICATION_CREDENTIALS=os.getenv("GOOGLE_APPLICATION_CREDENTIALS", ""),
+        HUGGINGFACE_TOKEN=os.getenv("HUGGINGFACE_TOKEN", ""),
+        FONT_PATH=_resolve_font("SHORTKINDS_FONT", _FONT_CANDIDATES),
+        FONT_TOP_PATH=_resolve_font("SHORTKINDS_TOP_FONT", _FONT_TOP_CANDIDATES),
+    )
+
+
+def get_config() -> AppConfig:
+    """프로세스 공유 설정 (install_config()로 설치된 설정, 없으면 .env에서 한 번 생성)"""
+    return _installed if _installed is not None else _load_config()
+
+
+def install_config(config: AppConfig):
+    """
+    공유 설정을 주어진 설정으로 교체 (spawn 워커 initializer용)
+    
+    워커가 .env/환경 변수에서 설정을 다시 만들지 않고 부모 프로세스의 설정을 그대로 쓴다.
+    `from config import Config`로 이름을 가져가는 모듈은 교체 후에 import 되어야 한다
+    (단계 모듈은 modules 패키지에서 처음 접근할 때 import 되므로 워커 작업 전에 교체하면 됨).
+    """
+    global _installed
+    _installed = config
+
+
+def __getattr__(name):
+    """
+    기존 `from config import Config` 사용처와 호환되는 공유 인스턴스 (PEP 562)
+    
+    모듈 import 시점이 아니라 처음 Config에 접근할 때 설정을 만들므로, spawn 워커에서
+    메인 모듈이 다시 import 되어도 initializer의 install_config()보다 먼저 .env를 읽지 않는다.
+    """
+    if name == "Config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,153 +4,368 @@ ShortKinds - 뉴스 숏츠 자동 생성 시스템
 
 사용법:
     python main.py --date 2025-02-06 --max-topics 5 --per-topic-docs 1
+    python main.py --date 2025-02-05 2025-02-06   # 모델을 한 번만 로드해 여러 날짜 처리
 """
 
 import argparse
+import logging
 import json
 import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
-from config import Config
-from modules import (
-    collect_news_issues,
-    crawl_articles,
-    summarize_articles,
-    generate_images,
-    generate_tts,
-    generate_video
-)
-
-
-def save_checkpoint(data: dict, filename: str):
-    """중간 결과 저장 (체크포인트)"""
-    path = os.path.join(Config.OUTPUT_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print(f"💾 체크포인트 저장: {path}")
-
-
-def load_checkpoint(filename: str):
-    """체크포인트 불러오기"""
-    path = os.path.join(Config.OUTPUT_DIR, filename)
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return None
+from typing import Dict, List, Optional
+import config
+import modules
+from modules._log import setup_logging, stop_logging, get_log_queue, init_worker_logging
+from modules._memo import memoize_article, memoize_stage
+from modules.checkpoint import CheckpointLog, load_checkpoint_log
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
-def main(date: str, max_topics: int = 5, per_topic_docs: int = 1, 
-         top_text: str = None, skip_to: str = None):
+logger = logging.getLogger(__name__)
+
+# 기사 단계별 출력 필드 (체크포인트 로그에 기록)
+STAGE_FIELDS = {
+    "summarize": ["summaries"],
+    "image": ["image_path", "quiz", "prompt"],
+    "tts": ["tts_files"],
+    "video": ["video_path"],
+}
+
+def _stage_cache(stage: str):
+    """단계별 캐시 설정: (해시 입력 필드, 출력 필드, 모델/설정 값)"""
+    cfg = config.get_config()
+    return {
+        "summarize": (
+            ["content"], STAGE_FIELDS["summarize"],
+            {"model": cfg.SUMMARY_MODEL, "parts": cfg.SUMMARY_PARTS,
+             "beams": cfg.SUMMARY_NUM_BEAMS},
+        ),
+        "image": (
+            ["summaries"], STAGE_FIELDS["image"],
+            {"size": cfg.IMAGE_SIZE, "quality": cfg.IMAGE_QUALITY},
+        ),
+        "tts": (
+            ["summaries"], STAGE_FIELDS["tts"],
+            {
+                "voice": cfg.TTS_VOICE_NAME,
+                "language": cfg.TTS_LANGUAGE_CODE,
+                "rate": cfg.TTS_SPEAKING_RATE,
+                "pitch": cfg.TTS_PITCH,
+            },
+        ),
+    }[stage]
+
+
+def _stage_fn(name: str):
+    """modules의 단계 함수를 호출 시점에 불러오는 래퍼 (무거운 import 지연)"""
+    def call(*args, **kwargs):
+        return getattr(modules, name)(*args, **kwargs)
+    call.__name__ = name
+    return call
+
+
+def _cached_article(stage: str, fn):
+    """기사 1개 단위 단계 함수에 캐시 적용"""
+    key_fields, out_fields, params = _stage_cache(stage)
+    return memoize_article(stage, key_fields, fn, params=params, out_fields=out_fields)
+
+
+def _cached_stage(stage: str, fn):
+    """기사 리스트 단위 단계 함수에 캐시 적용 (캐시 미스 기사만 한 번에 fn으로)"""
+    key_fields, out_fields, params = _stage_cache(stage)
+    return memoize_stage(stage, key_fields, fn, params=params, out_fields=out_fields)
+
+
+def _dumps(data) -> bytes:
+    """JSON 직렬화 (UTF-8 bytes, 들여쓰기 2칸)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_final_json(path: str, meta: Dict, articles: List[Dict]):
     """
-    메인 파이프라인 실행
+    최종 결과 JSON을 기사 단위로 직렬화해 저장
     
-    Args:
-        date: 수집할 날짜 (YYYY-MM-DD)
-        max_topics: 최대 토픽 개수
-        per_topic_docs: 토픽당 기사 개수
-        top_text: 영상 상단 공통 자막
-        skip_to: 특정 단계로 스킵 (collect, crawl, summarize, image, tts, video)
+    전체 문서를 한 번에 직렬화하지 않으므로 기사 수가 많아도 메모리에는
+    기사 1개 분량의 버퍼만 추가로 생긴다. 출력 형식은 들여쓰기 2칸 JSON과 같다.
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(b"{\n")
+        for key, value in meta.items():
+            f.write(b"  " + _dumps(key) + b": " + _dumps(value) + b",\n")
+        f.write(b'  "articles": [')
+        for i, art in enumerate(articles):
+            f.write(b",\n" if i else b"\n")
+            # JSON 문자열 안의 줄바꿈은 이스케이프되므로 줄 단위 들여쓰기 안전
+            f.write(b"\n".join(b"    " + line for line in _dumps(art).split(b"\n")))
+        f.write(b"\n  ]\n}\n" if articles else b"]\n}\n")
+
+
+def checkpoint_path(date: str) -> str:
+    """날짜별 체크포인트 로그 경로"""
+    return os.path.join(config.Config.OUTPUT_DIR, f"checkpoint_{date}.jsonl")
+
+
+def load_checkpoint(date: str):
+    """체크포인트 로그 불러오기 (재생 결과, 없으면 None)"""
+    return load_checkpoint_log(checkpoint_path(date))
+
+
+def _init_video_worker(parent_config, log_queue):
+    """영상 프로세스 initializer: 부모의 설정을 설치하고 로그를 부모 큐로 전달"""
+    config.install_config(parent_config)
+    if log_queue is not None:
+        init_worker_logging(log_queue)
+
+
+def _video_job(art: Dict, art_idx: int, top_text: Optional[str]) -> Dict:
+    """영상 프로세스 워커 (모듈 최상위 함수라야 pickle 가능)"""
+    return modules.generate_video_for_article(art, art_idx, top_text=top_text)
+
+
+class Pipeline:
     """
-    print("=" * 80)
-    print("🎬 ShortKinds - 뉴스 숏츠 자동 생성 시작")
-    print("=" * 80)
-    print(f"날짜: {date}")
-    print(f"최대 토픽: {max_topics}")
-    print(f"토픽당 기사: {per_topic_docs}")
-    print("=" * 80)
+    기사 단위 병렬 파이프라인 (요약 → 이미지 ∥ TTS → 영상)
     
-    # 설정 검증 및 디렉토리 생성
-    Config.validate()
-    Config.create_directories()
+    요약은 기사 묶음 단위로 실행해 여러 기사의 본문 조각을 한 배치로 생성하고,
+    요약이 끝난 기사는 다음 묶음의 요약과 동시에 이미지/TTS 생성을 시작하며,
+    두 결과가 모두 준비되면 영상을 생성한다. 기사별 단계 결과는 끝나는 즉시
+    체크포인트 로그에 추가하고, 단계가 모든 기사에 대해 끝나면 로그를 동기화한다.
+    
+    영상 인코딩은 CPU 작업이므로 별도 프로세스 풀에서 실행한다. 워커는 기사 사본을
+    받아 처리하므로 결과는 반환된 dict로 원본 기사에 반영한다.
+    """
+    
+    STAGES = ["summarize", "image", "tts", "video"]
+    
+    def __init__(self, log: CheckpointLog, top_text: Optional[str] = None,
+                 max_workers: int = 4, video_workers: int = 1):
+        self.log = log
+        self.top_text = top_text
+        self.max_workers = max_workers
+        self.video_workers = video_workers
+        # 캐시 적중 시에는 해당 모듈(torch, openai 등)을 import 하지 않음
+        self._summarize = _cached_stage("summarize", _stage_fn("summarize_articles"))
+        self._image = _cached_article("image", _stage_fn("generate_image_for_article"))
+        self._tts = _cached_article("tts", _stage_fn("generate_tts_for_article"))
+    
+    def _summarize_batches(self, articles: List[Dict]) -> List[List[int]]:
+        """
+        요약을 한 번에 실행할 기사 번호 묶음
+        
+        묶음마다 본문 조각이 generate 배치 하나(SUMMARY_BATCH_SIZE)를 채우도록 기사를
+        모은다. 전체를 한 묶음으로 하면 모든 요약이 끝날 때까지 이미지/TTS가 시작되지 않음.
+        """
+        per = max(1, config.Config.SUMMARY_BATCH_SIZE // max(1, config.Config.SUMMARY_PARTS))
+        idxs = list(range(1, len(articles) + 1))
+        return [idxs[k:k + per] for k in range(0, len(idxs), per)]
+    
+    def run(self, articles: List[Dict], start: str = "summarize") -> List[Dict]:
+        """
+        start 단계부터 마지막(영상)까지 실행
+        
+        Args:
+            articles: crawl_articles() 반환값 (재개 시 체크포인트 재생 결과)
+            start: 시작 단계 (summarize, image, tts, video)
+        """
+        active = self.STAGES[self.STAGES.index(start):]
+        media = [st for st in ("image", "tts") if st in active]
+        logger.info(f"\n⚙️ 파이프라인 시작: {len(articles)}개 기사 ({' → '.join(active)})")
+        
+        total = len(articles)
+        done = {stage: 0 for stage in active}
+        ready: Dict[int, set] = {}
+        for stage in active:
+            self.log.begin(stage)
+        
+        # 요약(로컬 모델)은 순차, 네트워크 단계는 스레드, 영상(CPU 인코딩)은 프로세스 병렬
+        # (spawn: 요약 스레드가 잡고 있는 잠금이 fork로 복제되지 않도록)
+        video_workers = max(1, min(self.video_workers, total))
+        video_init = dict(initializer=_init_video_worker, initargs=(config.get_config(), get_log_queue()))
+        with ThreadPoolExecutor(max_workers=1) as summarize_pool, \
+             ThreadPoolExecutor(max_workers=self.max_workers) as io_pool, \
+             ProcessPoolExecutor(max_workers=video_workers,
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 **video_init) as video_pool:
+            pending = {}
+            fns = {"image": self._image, "tts": self._tts}
+            
+            def submit_video(art, art_idx):
+                fut = video_pool.submit(_video_job, art, art_idx, self.top_text)
+                pending[fut] = ("video", art_idx, art)
+            
+            def submit_media(art, art_idx):
+                for st in media:
+                    pending[io_pool.submit(fns[st], art, art_idx)] = (st, art_idx, art)
+                if not media:
+                    submit_video(art, art_idx)
+            
+            def finish(stage, art, art_idx):
+                done[stage] += 1
+                self.log.append(stage, art_idx, {k: art.get(k) for k in STAGE_FIELDS[stage]})
+                
+                if stage == "summarize":
+                    submit_media(art, art_idx)
+                elif stage in media:
+                    ready.setdefault(art_idx, set()).add(stage)
+                    if len(ready[art_idx]) == len(media):
+                        submit_video(art, art_idx)
+                
+                if done[stage] == total:
+                    self.log.end(stage)
+            
+            if "summarize" in active:
+                # 요약 스레드는 하나이므로 묶음 순서대로 실행됨
+                for idxs in self._summarize_batches(articles):
+                    batch = [articles[i - 1] for i in idxs]
+                    pending[summarize_pool.submit(self._summarize, batch)] = ("summarize", idxs, batch)
+            else:
+                for art_idx, art in enumerate(articles, 1):
+                    submit_media(art, art_idx)
+            
+            try:
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        stage, art_idx, art = pending.pop(fut)
+                        res = fut.result()
+                        if stage == "summarize":
+                            # 묶음 단위 (memoize_stage가 기사 dict를 제자리에서 갱신)
+                            for i, a in zip(art_idx, art):
+                                finish(stage, a, i)
+                            continue
+                        if res is not art:
+                            art.update(res)
+                        finish(stage, art, art_idx)
+            except BaseException:
+                for fut in pending:
+                    fut.cancel()
+                raise
+        
+        logger.info(f"✅ 파이프라인 완료: {len(articles)}개 기사")
+        return articles
+
+
+# 전체 단계 순서 (--skip-to는 해당 단계부터 재개)
+STAGES = ["collect", "crawl"] + Pipeline.STAGES
+
+
+def run_stages(log: CheckpointLog, state: Optional[Dict], date: str, max_topics: int,
+               per_topic_docs: int, top_text: Optional[str], start: str = "collect"):
+    """
+    start 단계부터 끝까지 실행
+    
+    Args:
+        log: 체크포인트 로그
+        state: 재개 시 load_checkpoint() 결과 (처음부터 실행하면 None)
+        start: 시작 단계 (STAGES 중 하나)
+    
+    Returns:
+        최종 기사 리스트 (기사가 없으면 None)
+    """
+    start_idx = STAGES.index(start)
     
     # ===== 1. 뉴스 이슈 수집 =====
-    if skip_to is None or skip_to == "collect":
-        issues = collect_news_issues(date=date, max_topics=max_topics)
-        save_checkpoint(issues, f"checkpoint_1_issues_{date}.json")
+    if start_idx <= STAGES.index("collect"):
+        issues = modules.collect_news_issues(date=date, max_topics=max_topics)
+        log.begin("collect")
+        log.append("collect", None, issues)
+        log.end("collect")
     else:
-        issues = load_checkpoint(f"checkpoint_1_issues_{date}.json")
-        if issues is None:
-            raise ValueError("체크포인트 파일이 없습니다. skip_to를 사용할 수 없습니다.")
-    
-    if skip_to == "collect":
-        return
+        issues = state["issues"]
     
     # ===== 2. 기사 크롤링 =====
-    if skip_to is None or skip_to == "crawl":
-        articles = crawl_articles(issues, per_topic_docs=per_topic_docs)
-        save_checkpoint({"articles": articles}, f"checkpoint_2_articles_{date}.json")
+    if start_idx <= STAGES.index("crawl"):
+        articles = modules.crawl_articles(issues, per_topic_docs=per_topic_docs)
+        log.begin("crawl")
+        for art_idx, art in enumerate(articles, 1):
+            log.append("crawl", art_idx, art)
+        log.end("crawl")
     else:
-        checkpoint = load_checkpoint(f"checkpoint_2_articles_{date}.json")
-        articles = checkpoint["articles"] if checkpoint else []
-    
-    if skip_to == "crawl":
-        return
+        articles = [state["articles"][k] for k in sorted(state["articles"])]
     
     if not articles:
-        print("❌ 수집된 기사가 없습니다.")
-        return
+        logger.warning("❌ 수집된 기사가 없습니다.")
+        return None
     
-    # ===== 3. 기사 요약 =====
-    if skip_to is None or skip_to == "summarize":
-        articles = summarize_articles(articles)
-        save_checkpoint({"articles": articles}, f"checkpoint_3_summaries_{date}.json")
-    else:
-        checkpoint = load_checkpoint(f"checkpoint_3_summaries_{date}.json")
-        articles = checkpoint["articles"] if checkpoint else []
+    # ===== 3~6. 요약 → 이미지/TTS → 영상 (기사 단위 병렬) =====
+    pipeline_start = STAGES[max(start_idx, STAGES.index("summarize"))]
+    return Pipeline(log, top_text=top_text,
+                    max_workers=config.Config.PIPELINE_WORKERS,
+                    video_workers=config.Config.VIDEO_WORKERS).run(articles, start=pipeline_start)
+
+
+def main(date: str, max_topics: int = 5, per_topic_docs: int = 1, 
+         top_text: str = None, skip_to: str = None):
+    """
+    메인 파이프라인 실행
     
-    if skip_to == "summarize":
-        return
+    Args:
+        date: 수집할 날짜 (YYYY-MM-DD)
+        max_topics: 최대 토픽 개수
+        per_topic_docs: 토픽당 기사 개수
+        top_text: 영상 상단 공통 자막
+        skip_to: 이 단계부터 재개 (collect, crawl, summarize, image, tts, video)
+    """
+    logger.info("=" * 80)
+    logger.info("🎬 ShortKinds - 뉴스 숏츠 자동 생성 시작")
+    logger.info("=" * 80)
+    logger.info(f"날짜: {date}")
+    logger.info(f"최대 토픽: {max_topics}")
+    logger.info(f"토픽당 기사: {per_topic_docs}")
+    logger.info("=" * 80)
     
-    # ===== 4. 이미지 생성 =====
-    if skip_to is None or skip_to == "image":
-        articles = generate_images(articles)
-        save_checkpoint({"articles": articles}, f"checkpoint_4_images_{date}.json")
-    else:
-        checkpoint = load_checkpoint(f"checkpoint_4_images_{date}.json")
-        articles = checkpoint["articles"] if checkpoint else []
+    # 설정 검증 및 디렉토리 생성
+    config.Config.validate()
+    config.Config.create_directories()
     
-    if skip_to == "image":
-        return
+    # 체크포인트 로그 (수집부터 다시 실행하면 새로 작성)
+    start = skip_to or STAGES[0]
+    state = None
+    if start != STAGES[0]:
+        state = load_checkpoint(date)
+        if state is None:
+            raise ValueError("체크포인트 파일이 없습니다. skip_to를 사용할 수 없습니다.")
+        missing = [st for st in STAGES[:STAGES.index(start)] if st not in state["completed"]]
+        if missing:
+            raise ValueError(f"이전 단계가 완료되지 않았습니다: {', '.join(missing)}")
     
-    # ===== 5. TTS 생성 =====
-    if skip_to is None or skip_to == "tts":
-        articles = generate_tts(articles)
-        save_checkpoint({"articles": articles}, f"checkpoint_5_tts_{date}.json")
-    else:
-        checkpoint = load_checkpoint(f"checkpoint_5_tts_{date}.json")
-        articles = checkpoint["articles"] if checkpoint else []
+    with CheckpointLog(checkpoint_path(date), resume=state is not None) as log:
+        articles = run_stages(log, state, date, max_topics, per_topic_docs, top_text, start)
     
-    if skip_to == "tts":
+    if articles is None:
         return
     
-    # ===== 6. 영상 생성 =====
-    articles = generate_video(articles, top_text=top_text)
-    
     # ===== 최종 결과 저장 =====
-    final_output = {
+    meta = {
         "date": date,
         "created_at": datetime.now().isoformat(),
         "total_articles": len(articles),
-        "articles": articles
     }
     
-    final_path = os.path.join(Config.OUTPUT_DIR, f"final_result_{date}.json")
-    with open(final_path, "w", encoding="utf-8") as f:
-        json.dump(final_output, f, ensure_ascii=False, indent=2)
+    final_path = os.path.join(config.Config.OUTPUT_DIR, f"final_result_{date}.json")
+    write_final_json(final_path, meta, articles)
     
-    print("\n" + "=" * 80)
-    print("✅ 전체 파이프라인 완료!")
-    print("=" * 80)
-    print(f"📊 총 {len(articles)}개 기사 처리")
-    print(f"📁 결과 저장: {final_path}")
-    print(f"📁 영상 저장: {Config.VIDEOS_DIR}")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    logger.info("✅ 전체 파이프라인 완료!")
+    logger.info("=" * 80)
+    logger.info(f"📊 총 {len(articles)}개 기사 처리")
+    logger.info(f"📁 결과 저장: {final_path}")
+    logger.info(f"📁 영상 저장: {config.Config.VIDEOS_DIR}")
+    logger.info("=" * 80)
     
     # 생성된 영상 목록 출력
     videos = [art.get("video_path") for art in articles if art.get("video_path")]
     if videos:
-        print(f"\n🎥 생성된 영상 ({len(videos)}개):")
+        logger.info(f"\n🎥 생성된 영상 ({len(videos)}개):")
         for v in videos:
-            print(f"  - {v}")
+            logger.info(f"  - {v}")
 
 
 if __name__ == "__main__":
@@ -161,8 +376,9 @@ if __name__ == "__main__":
     parser.add_argument(
         "--date",
         type=str,
-        default=datetime.now().strftime("%Y-%m-%d"),
-        help="수집할 날짜 (YYYY-MM-DD, 기본값: 오늘)"
+        nargs="+",
+        default=[datetime.now().strftime("%Y-%m-%d")],
+        help="수집할 날짜 (YYYY-MM-DD, 여러 개면 한 프로세스에서 차례로 실행, 기본값: 오늘)"
     )
     
     parser.add_argument(
@@ -191,21 +407,24 @@ if __name__ == "__main__":
         type=str,
         choices=["collect", "crawl", "summarize", "image", "tts", "video"],
         default=None,
-        help="특정 단계로 스킵 (체크포인트 필요)"
+        help="이 단계부터 끝까지 재개 (체크포인트 필요)"
     )
     
     args = parser.parse_args()
+    setup_logging()
     
     try:
-        main(
-            date=args.date,
-            max_topics=args.max_topics,
-            per_topic_docs=args.per_topic_docs,
-            top_text=args.top_text,
-            skip_to=args.skip_to
-        )
+        # 여러 날짜를 한 프로세스에서 처리하면 요약/Llama 모델과 CUDA 그래프를 날짜 간 재사용
+        for date in args.date:
+            main(
+                date=date,
+                max_topics=args.max_topics,
+                per_topic_docs=args.per_topic_docs,
+                top_text=args.top_text,
+                skip_to=args.skip_to
+            )
     except Exception as e:
-        print(f"\n❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"\n❌ 오류 발생: {e}")
         exit(1)
+    finally:
+        stop_logging()
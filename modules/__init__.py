@@ -1,19 +1,36 @@
 """
 ShortKinds 뉴스 자동화 모듈
+
+각 단계 모듈(torch, transformers, openai, moviepy 등)은 무거우므로
+함수에 처음 접근할 때 해당 모듈만 import 한다 (PEP 562).
 """
 
-from .news_collector import collect_news_issues
-from .crawler import crawl_articles
-from .summarizer import summarize_articles
-from .image_gen import generate_images
-from .tts_gen import generate_tts
-from .video_gen import generate_video
-
-__all__ = [
-    'collect_news_issues',
-    'crawl_articles', 
-    'summarize_articles',
-    'generate_images',
-    'generate_tts',
-    'generate_video'
-]
+import importlib
+
+# 공개 함수 -> 정의된 하위 모듈
+_LAZY = {
+    'collect_news_issues': '.news_collector',
+    'crawl_articles': '.crawler',
+    'summarize_articles': '.summarizer',
+    'generate_images': '.image_gen',
+    'generate_image_for_article': '.image_gen',
+    'generate_tts': '.tts_gen',
+    'generate_tts_for_article': '.tts_gen',
+    'generate_video': '.video_gen',
+    'generate_video_for_article': '.video_gen',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
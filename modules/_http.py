@@ -0,0 +1,43 @@
+"""
+공유 HTTP 세션 (keep-alive 연결 풀 + 일시 오류 재시도)
+
+뉴스 이슈 수집과 기사 크롤링이 같은 KINDS 세션을 쓰므로 tools.kinds.or.kr
+TLS 연결을 단계 간에도 재사용한다.
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+KINDS_HEADERS = {
+    "Content-Type": "application/json; charset=UTF-8",
+    "Accept": "application/json",
+}
+
+# (연결, 읽기) 타임아웃 초
+CONNECT_TIMEOUT = 3.05
+
+
+def make_session(headers: Dict[str, str]) -> requests.Session:
+    """keep-alive 연결 풀 + 일시 오류 재시도 세션"""
+    session = requests.Session()
+    retry = Retry(
+        total=3, backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    session.headers.update(headers)
+    return session
+
+
+@lru_cache(maxsize=1)
+def kinds_session() -> requests.Session:
+    """KINDS API 세션 (크롤링용 브라우저 헤더와 분리)"""
+    return make_session(KINDS_HEADERS)
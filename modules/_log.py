@@ -0,0 +1,62 @@
+"""
+로그 출력 설정 (QueueHandler -> 백그라운드 QueueListener)
+
+각 모듈은 logging.getLogger(__name__)으로 기록하고, 실제 출력은 메인 프로세스의
+리스너 스레드 하나가 담당한다. 파이프라인 워커 스레드/영상 프로세스는 큐에 넣기만
+하므로 느린 터미널이나 파이프 출력 때문에 멈추지 않는다.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+# 이 프로젝트의 로거만 INFO로 출력 (httpx 등 라이브러리 로그는 WARNING 이상만)
+_PROJECT_LOGGERS = ("__main__", "main", "config", "modules")
+
+_queue = None
+_listener = None
+
+
+def _attach(queue, level: int):
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(queue)]
+    root.setLevel(logging.WARNING)
+    for name in _PROJECT_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+
+
+def setup_logging(level: int = logging.INFO):
+    """메인 프로세스 로그 설정 (여러 번 호출해도 한 번만 적용)"""
+    global _queue, _listener
+    if _listener is not None:
+        return _queue
+
+    # 영상 프로세스(spawn)에서도 같은 큐로 기록할 수 있도록 프로세스 간 큐 사용
+    _queue = multiprocessing.get_context("spawn").Queue(-1)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(_queue, handler)
+    _listener.start()
+    _attach(_queue, level)
+    atexit.register(stop_logging)
+    return _queue
+
+
+def get_log_queue():
+    """setup_logging()으로 만든 큐 (설정 전이면 None)"""
+    return _queue
+
+
+def init_worker_logging(queue, level: int = logging.INFO):
+    """워커 프로세스 초기화 함수: 메인 프로세스의 큐로 로그 전달"""
+    _attach(queue, level)
+
+
+def stop_logging():
+    """남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
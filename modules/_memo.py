@@ -0,0 +1,241 @@
+"""
+단계별 결과 캐시 (기사 내용 해시 기반 메모이제이션)
+"""
+
+import os
+import logging
+import json
+import shutil
+import hashlib
+import functools
+from typing import Any, Callable, Dict, List, Optional
+import config
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 압축 없이 저장
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(payload: Any) -> str:
+    """입력 데이터의 SHA-256 해시"""
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _stage_dir(stage_name: str) -> str:
+    return os.path.join(config.Config.CACHE_DIR, stage_name)
+
+
+def _article_key(art: Dict, key_fields: List[str], params: Optional[Dict]) -> str:
+    return content_hash({
+        "fields": {k: art.get(k) for k in key_fields},
+        "params": params or {},
+    })
+
+
+def _artifact_paths(value: Any) -> List[str]:
+    """값에 포함된 실제 파일 경로 목록"""
+    if isinstance(value, str):
+        return [value] if value and os.path.isfile(value) else []
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str) and v and os.path.isfile(v)]
+    return []
+
+
+def _copy_artifacts(value: Any, dest_dir: str) -> Any:
+    """파일 경로를 캐시 디렉토리 사본 경로로 교체"""
+    if isinstance(value, list):
+        return [_copy_artifacts(v, dest_dir) for v in value]
+    if not _artifact_paths(value):
+        return value
+    os.makedirs(dest_dir, exist_ok=True)
+    dest = os.path.join(dest_dir, os.path.basename(value))
+    shutil.copyfile(value, dest)
+    return dest
+
+
+def lookup(stage_name: str, key: str) -> Optional[Dict]:
+    """캐시된 단계 결과 조회 (참조 파일이 없으면 미스)"""
+    path = os.path.join(_stage_dir(stage_name), f"{key}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            fields = json.load(f)
+    except (OSError, ValueError):
+        return None
+    for value in fields.values():
+        paths = value if isinstance(value, list) else [value]
+        for p in paths:
+            if isinstance(p, str) and p.startswith(config.Config.CACHE_DIR) and not os.path.isfile(p):
+                return None
+    return fields
+
+
+def store(stage_name: str, key: str, before: Dict, after: Dict,
+          out_fields: Optional[List[str]] = None) -> None:
+    """
+    단계가 추가/변경한 필드만 저장 (파일은 캐시로 복사)
+
+    out_fields가 주어지면 해당 필드만 저장한다. 같은 기사 dict를 여러 단계가
+    동시에 갱신하는 경우(파이프라인) 다른 단계의 결과가 섞이지 않도록 지정.
+    """
+    stage_dir = _stage_dir(stage_name)
+    os.makedirs(stage_dir, exist_ok=True)
+    artifact_dir = os.path.join(stage_dir, key)
+
+    fields = {}
+    if out_fields is not None:
+        items = [(k, after.get(k)) for k in out_fields]
+    else:
+        items = [(k, v) for k, v in after.items() if k not in before or before[k] != v]
+    for k, v in items:
+        fields[k] = _copy_artifacts(v, artifact_dir)
+
+    path = os.path.join(stage_dir, f"{key}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(fields, f, ensure_ascii=False, indent=2)
+
+
+def memoize_article(stage_name: str, key_fields: List[str],
+                    fn: Callable[..., Dict],
+                    params: Optional[Dict] = None,
+                    out_fields: Optional[List[str]] = None) -> Callable[..., Dict]:
+    """
+    기사 1개 단위 단계 함수를 캐시로 감싸기
+
+    Args:
+        stage_name: 캐시 네임스페이스 (outputs/cache/<stage_name>/)
+        key_fields: 해시에 포함할 기사 필드
+        fn: 원래 단계 함수 (art, *args -> art)
+        params: 해시에 포함할 모델/설정 값
+        out_fields: 캐시에 저장할 출력 필드 (없으면 변경된 필드 전체)
+
+    Returns:
+        캐시 적중 시 fn 호출을 건너뛰는 래퍼 함수
+    """
+    def wrapped(art: Dict, *args, **kwargs) -> Dict:
+        key = _article_key(art, key_fields, params)
+        cached = lookup(stage_name, key)
+        if cached is not None:
+            art.update(cached)
+            return art
+
+        before = dict(art)
+        res = fn(art, *args, **kwargs)
+        if res is not art:
+            art.clear()
+            art.update(res)
+        store(stage_name, key, before, art, out_fields)
+        return art
+
+    wrapped.__name__ = getattr(fn, "__name__", stage_name)
+    wrapped.__doc__ = fn.__doc__
+    return wrapped
+
+
+def memoize_stage(stage_name: str, key_fields: List[str],
+                  fn: Callable[..., List[Dict]],
+                  params: Optional[Dict] = None,
+                  out_fields: Optional[List[str]] = None) -> Callable[..., List[Dict]]:
+    """
+    기사 리스트 단계 함수를 캐시로 감싸기
+
+    Args:
+        stage_name: 캐시 네임스페이스 (outputs/cache/<stage_name>/)
+        key_fields: 해시에 포함할 기사 필드
+        fn: 원래 단계 함수 (articles -> articles)
+        params: 해시에 포함할 모델/설정 값
+        out_fields: 캐시에 저장할 출력 필드 (없으면 변경된 필드 전체)
+
+    Returns:
+        캐시 미스 기사만 fn에 넘기는 래퍼 함수
+    """
+    def wrapped(articles: List[Dict], *args, **kwargs) -> List[Dict]:
+        keys = [_article_key(art, key_fields, params) for art in articles]
+        misses, miss_keys = [], []
+
+        for art, key in zip(articles, keys):
+            cached = lookup(stage_name, key)
+            if cached is None:
+                misses.append(art)
+                miss_keys.append(key)
+            else:
+                art.update(cached)
+
+        hits = len(articles) - len(misses)
+        if hits:
+            logger.info(f"♻️ 캐시 적중 [{stage_name}]: {hits}/{len(articles)}개 기사")
+
+        if misses:
+            before = [dict(art) for art in misses]
+            results = fn(misses, *args, **kwargs)
+            for art, res, key, prev in zip(misses, results, miss_keys, before):
+                if res is not art:
+                    art.clear()
+                    art.update(res)
+                store(stage_name, key, prev, art, out_fields)
+
+        return articles
+
+    wrapped.__name__ = getattr(fn, "__name__", stage_name)
+    wrapped.__doc__ = fn.__doc__
+    return wrapped
+
+
+def _read_blob(base: str) -> Optional[Any]:
+    """base.json.zst 또는 base.json 읽기"""
+    try:
+        if zstandard is not None and os.path.exists(base + ".json.zst"):
+            with open(base + ".json.zst", "rb") as f:
+                raw = zstandard.ZstdDecompressor().decompress(f.read())
+            return json.loads(raw.decode("utf-8"))
+        if os.path.exists(base + ".json"):
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError, getattr(zstandard, "ZstdError", ValueError)):
+        pass
+    return None
+
+
+def _write_blob(base: str, value: Any) -> None:
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+    if zstandard is not None:
+        with open(base + ".json.zst", "wb") as f:
+            f.write(zstandard.ZstdCompressor(level=3).compress(raw))
+    else:
+        with open(base + ".json", "wb") as f:
+            f.write(raw)
+
+
+def disk_memoize(namespace: str, key: Callable[..., str],
+                 when: Optional[Callable[..., bool]] = None):
+    """
+    함수 결과를 디스크에 캐시하는 데코레이터
+
+    Args:
+        namespace: 캐시 디렉토리 (outputs/cache/<namespace>/)
+        key: 호출 인자 -> 캐시 키 (파일명으로 사용)
+        when: 호출 인자 -> 캐시 사용 여부 (없으면 항상 사용)
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapped(*args, **kwargs):
+            if when is not None and not when(*args, **kwargs):
+                return fn(*args, **kwargs)
+
+            base = os.path.join(config.Config.CACHE_DIR, namespace, key(*args, **kwargs))
+            cached = _read_blob(base)
+            if cached is not None:
+                logger.info(f"♻️ 캐시 적중 [{namespace}]: {os.path.basename(base)}")
+                return cached
+
+            result = fn(*args, **kwargs)
+            _write_blob(base, result)
+            return result
+        return wrapped
+    return decorator
@@ -0,0 +1,250 @@
+"""
+추가 전용(JSONL) 체크포인트 로그
+"""
+
+import os
+import logging
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 압축 없이 기록
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps_line(row: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads_line(line: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line.decode("utf-8"))
+
+
+def _artifact_paths(fields: Dict[str, Any]) -> List[str]:
+    """필드 값 중 실제 파일 경로 (이미지, 음성 등)"""
+    paths = []
+    for value in fields.values():
+        for v in (value if isinstance(value, list) else [value]):
+            if isinstance(v, str) and len(v) < 1024 and os.path.isfile(v):
+                paths.append(v)
+    return paths
+
+
+def _fsync_path(path: str, directory: bool = False):
+    flags = os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        # Windows는 디렉토리 fd를 열 수 없음
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _zst_path(path: str) -> str:
+    return path + ".zst"
+
+
+def _existing_log(path: str) -> str:
+    """이미 기록된 로그 파일 (압축본 우선)"""
+    if zstandard is not None and os.path.exists(_zst_path(path)):
+        return _zst_path(path)
+    return path
+
+
+def _scan_log(data: bytes, zst: bool) -> Tuple[int, bytes]:
+    """
+    로그에서 온전히 기록된 앞부분 찾기
+    
+    Returns:
+        (온전한 부분의 바이트 길이, 그 부분의 내용(.zst는 해제한 줄들))
+        비정상 종료로 닫히지 않은 마지막 프레임 / 줄바꿈 없는 마지막 줄은 제외
+    """
+    if not zst:
+        end = data.rfind(b"\n") + 1
+        return end, data[:end]
+    dctx = zstandard.ZstdDecompressor()
+    view = memoryview(data)
+    end, chunks = 0, []
+    while end < len(data):
+        dobj = dctx.decompressobj()
+        try:
+            chunk = dobj.decompress(view[end:])
+        except zstandard.ZstdError:
+            break
+        if not dobj.eof:
+            break
+        chunks.append(chunk)
+        end = len(data) - len(dobj.unused_data)
+    return end, b"".join(chunks)
+
+
+def _read_lines(path: str) -> List[bytes]:
+    """로그 줄 읽기 (.zst는 프레임을 이어서 해제, 잘린 마지막 프레임/줄은 무시)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    _, content = _scan_log(data, path.endswith(".zst"))
+    return content.splitlines(keepends=True)
+
+
+def _truncate_torn_tail(path: str):
+    """
+    재개 전에 잘린 마지막 프레임/줄을 잘라냄
+    
+    그대로 덧붙이면 깨진 프레임(또는 잘린 줄) 뒤에 새 기록이 붙어, 다음 재생 때
+    재개 후 기록이 통째로 무시되거나 첫 줄이 망가진다.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        data = f.read()
+        end, _ = _scan_log(data, path.endswith(".zst"))
+        if end < len(data):
+            logger.warning(f"⚠️ 체크포인트 끝의 잘린 기록 {len(data) - end}바이트 제거: {path}")
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class CheckpointLog:
+    """
+    단계 결과를 한 줄씩 덧붙이는 체크포인트 로그
+
+    각 줄은 단계가 새로 만든 필드만 담는다:
+        {"stage": "summarize", "article_id": 3, "fields": {"summaries": [...]}}
+    단계 시작/종료는 {"stage": ..., "event": "begin" | "end"} 줄로 표시한다.
+    쓰기는 64KiB 버퍼에 모았다가 단계 종료 시 한 번 fsync 한다.
+    기록된 필드가 가리키는 결과 파일도 같은 시점에 모아서 fsync 하므로,
+    로그에 남은 경로는 항상 디스크에 내려간 파일을 가리킨다.
+    
+    zstandard가 설치되어 있으면 <path>.zst에 zstd(level 3)로 압축해 기록한다.
+    동기화할 때마다 프레임을 닫으므로 비정상 종료 시에도 이전 단계까지는 읽을 수 있다.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        if resume:
+            self.path = _existing_log(path)
+            _truncate_torn_tail(self.path)
+        else:
+            self.path = _zst_path(path) if zstandard is not None else path
+        self._raw = open(self.path, "ab" if resume else "wb", buffering=64 << 10)
+        self._zst = self.path.endswith(".zst")
+        if self._zst:
+            self._f = zstandard.ZstdCompressor(level=3).stream_writer(self._raw, closefd=False)
+        else:
+            self._f = self._raw
+        self._pending: Set[str] = set()
+
+    def begin(self, stage: str):
+        self._f.write(_dumps_line({"stage": stage, "event": "begin"}))
+
+    def append(self, stage: str, article_id: Optional[int], fields: Dict[str, Any]):
+        self._f.write(_dumps_line({"stage": stage, "article_id": article_id, "fields": fields}))
+        self._pending.update(_artifact_paths(fields))
+
+    def end(self, stage: str):
+        self._f.write(_dumps_line({"stage": stage, "event": "end"}))
+        self.sync()
+        logger.info(f"💾 체크포인트 기록: {stage} → {self.path}")
+
+    def sync(self):
+        # 결과 파일 -> 디렉토리 -> 로그 순서로 내려야 재개 시 빈 파일을 참조하지 않음
+        if self._pending:
+            for p in self._pending:
+                _fsync_path(p)
+            for d in {os.path.dirname(os.path.abspath(p)) for p in self._pending}:
+                _fsync_path(d, directory=True)
+            self._pending.clear()
+        if self._zst:
+            self._f.flush(zstandard.FLUSH_FRAME)
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+
+    def close(self):
+        if not self._raw.closed:
+            self.sync()
+            if self._zst:
+                self._f.close()
+            self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_checkpoint_log(path: str) -> Optional[Dict[str, Any]]:
+    """
+    체크포인트 로그 재생
+
+    Returns:
+        {
+            "issues": collect 단계 결과,
+            "articles": {article_id: 기사 dict, ...},
+            "completed": [종료 표시까지 기록된 단계, ...]
+        }
+        로그가 없으면 None
+    """
+    try:
+        lines = _read_lines(_existing_log(path))
+    except FileNotFoundError:
+        return None
+
+    issues = None
+    articles: Dict[int, Dict] = {}
+    completed: List[str] = []
+
+    for line in lines:
+        try:
+            row = _loads_line(line)
+        except ValueError:
+            # 비정상 종료로 잘린 마지막 줄
+            continue
+        stage = row.get("stage")
+        event = row.get("event")
+
+        if event == "begin":
+            # 단계를 다시 시작하면 그 단계의 완료 기록은 무효,
+            # 수집/크롤링을 다시 하면 기사별 기록 전체가 무효
+            if stage == "collect":
+                completed.clear()
+                articles.clear()
+            elif stage == "crawl":
+                completed[:] = [st for st in completed if st == "collect"]
+                articles.clear()
+            elif stage in completed:
+                completed.remove(stage)
+            continue
+        if event == "end":
+            if stage not in completed:
+                completed.append(stage)
+            continue
+
+        fields = row.get("fields") or {}
+        if stage == "collect":
+            issues = fields
+        elif stage == "crawl":
+            articles[row["article_id"]] = dict(fields)
+        elif row.get("article_id") in articles:
+            articles[row["article_id"]].update(fields)
+
+    return {"issues": issues, "articles": articles, "completed": completed}
@@ -2,24 +2,43 @@
 뉴스 기사 크롤링 및 본문 추출
 """
 
-import os
+import codecs
+import logging
 import re
 import time
 import random
 import unicodedata
 import requests
 import json
-from typing import List, Dict, Optional, Tuple
+import threading
+import soupsieve as sv
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Dict, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlunparse
-from bs4 import BeautifulSoup, UnicodeDammit
+from bs4 import BeautifulSoup, Tag, UnicodeDammit
 from dateutil import parser
 from config import Config
+from ._http import CONNECT_TIMEOUT, kinds_session, make_session
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"  # libxml2 C 파서 (html.parser보다 빠름)
+except ImportError:  # lxml 미설치 시 표준 파서 사용
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # ─────────────────────────────────────────────────────────────
 # 설정 및 상수
 # ─────────────────────────────────────────────────────────────
 
-SAVE_ONLY_PROVIDERS = set(Config.ISSUE_PROVIDERS_FILTER)
+SAVE_ONLY_PROVIDERS = Config.ISSUE_PROVIDERS_FILTER
 
 NOISY_PATTERNS = re.compile(
     r"(ad|ads|advert|sponsor|banner|promo|related|recommend|rec-|"
@@ -27,6 +46,7 @@ NOISY_PATTERNS = re.compile(
     r"widget|sidebar|nav|breadcrumb|comment|emoji|btn|login|"
     r"headline_list|breaking|hot|most|popular)", re.I
 )
+NOISY_ROLES = frozenset({"banner", "complementary", "navigation"})
 
 BAN_SUBSTRINGS = [
     "all rights reserved", "무단 전재", "무단전재", "재배포 금지", "ai학습 이용 금지",
@@ -37,6 +57,8 @@ BAN_SUBSTRINGS = [
     "문의:", "문의 ‧ 제보", "제보:", "광고 문의", "후원하기",
     "사진=", "영상="
 ]
+# 금지 문구 전체를 한 번에 찾는 정규식 (소문자로 바꾼 줄에서 검색, 기존 `in` 검사와 동일)
+BAN_RE = re.compile("|".join(re.escape(bad.lower()) for bad in BAN_SUBSTRINGS))
 
 DOMAIN_SELECTORS = {
     # 국민일보
@@ -115,10 +137,29 @@ DOMAIN_SELECTORS = {
     ],
 }
 
+GENERIC_SELECTORS = [
+    "div#articleBodyContents", "div#newsEndContents",
+    "div.article_body", "div#articeBody", "div.article",
+    "div#content", "div#contents", ".article-body", ".content"
+]
+
+# CSS 선택자는 import 시 한 번만 컴파일
+DOMAIN_SELECTORS_C = {host: [sv.compile(sel) for sel in sels] for host, sels in DOMAIN_SELECTORS.items()}
+GENERIC_SELECTORS_C = [sv.compile(sel) for sel in GENERIC_SELECTORS]
+ITEMPROP_BODY_SEL = sv.compile('[itemprop="articleBody"]')
+NOISY_TAGS_SEL = sv.compile("script, style, noscript, iframe, form, aside, nav, header, footer")
+
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 URL_RE = re.compile(r"https?://\S+")
 MULTIDASH_RE = re.compile(r"[-–—]{3,}")
-SENTENCE_END_RE = re.compile(r"[\.!?…]|[다요죠]\s*$|["']\s*$")
+# 문서 앞부분의 <meta charset="..."> / <meta http-equiv content="...; charset=...">
+META_CHARSET_RE = re.compile(rb"""<\s*meta[^>]+charset\s*=\s*["']?([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 2048
+
+JSONLD_RE = re.compile(r"<script[^>]*application/ld\+json[^>]*>(.*?)</script>", re.I | re.S)
+SENTENCE_END_RE = re.compile(r"[\.!?…]|[다요죠]\s*$|[\"'”’]\s*$")
+# SENTENCE_END_RE 가 확실히 매치되는 마지막 글자 (정규식 없이 먼저 확인)
+SENTENCE_END_CHARS = frozenset(".!?…다요죠\"'”’")
 
 REQ_HEADERS = {
     "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -129,7 +170,22 @@ REQ_HEADERS = {
 
 DENY_FALLBACK_HOSTS = set()
 
-KINDS_HEADERS = {"Content-Type": "application/json"}
+# 줄 구조를 유지해 정리하는 방송사 호스트 (부분 문자열 일치)
+BROADCAST_HOSTS = ("imnews.imbc.com", "news.kbs.co.kr")
+
+# 리라이트 후보 동시 요청 수 / 호스트별 동시 요청 수
+CANDIDATE_WORKERS = 4
+PER_HOST_CONCURRENCY = 2
+KINDS_BATCH_SIZE = 100  # 상세 조회 1회에 보내는 news_id 최대 개수
+
+# ─────────────────────────────────────────────────────────────
+# HTTP 세션
+# ─────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """원문 크롤링 세션 (브라우저 헤더 기본 적용)"""
+    return make_session(REQ_HEADERS)
 
 # ─────────────────────────────────────────────────────────────
 # 유틸리티 함수
@@ -143,13 +199,18 @@ def clean_date(raw_date: str) -> str:
     except Exception:
         return raw_date
 
+_WS_RUN_RE = re.compile(r"[ \t]+")
+_MULTI_NL_RE = re.compile(r"\n{3,}")
+
 def normalize_text(s: str) -> str:
     if not s:
         return ""
-    s = unicodedata.normalize("NFKC", s)
+    # ASCII는 NFKC 정규화 결과가 같으므로 생략
+    if not s.isascii():
+        s = unicodedata.normalize("NFKC", s)
     s = s.replace("\r\n", "\n")
-    s = re.sub(r"[ \t]+", " ", s)
-    s = re.sub(r"\n{3,}", "\n\n", s.strip())
+    s = _WS_RUN_RE.sub(" ", s)
+    s = _MULTI_NL_RE.sub("\n\n", s.strip())
     return s
 
 def safe_filename(name: str, maxlen: int = 80) -> str:
@@ -168,34 +229,51 @@ def _line_is_noise(line: str) -> bool:
         return True
     if MULTIDASH_RE.search(s):
         return True
-    for bad in BAN_SUBSTRINGS:
-        if bad.lower() in low:
-            return True
+    if BAN_RE.search(low):
+        return True
     if len(s) < 15:
         return True
     return False
 
 def _strip_noisy_nodes(soup: BeautifulSoup) -> None:
-    for tag in soup.select("script, style, noscript, iframe, form, aside, nav, header, footer"):
+    for tag in NOISY_TAGS_SEL.select(soup):
         try:
             tag.decompose()
         except Exception:
             pass
-    for node in list(soup.find_all(True)):
+    # 순회 중에는 트리를 건드리지 않고 제거 대상만 모은 뒤 한 번에 제거
+    # (전위 순회라 부모가 먼저 판정되므로, 제거될 부모의 자손은 검사 없이 건너뜀)
+    to_kill: List[Tag] = []
+    killed: set = set()
+    for node in soup.descendants:
+        if not isinstance(node, Tag):
+            continue
+        if id(node.parent) in killed:
+            killed.add(id(node))
+            continue
         try:
-            node_id = node.get("id") or ""
-            cls = node.get("class") or []
+            # id와 class를 한 문자열로 묶어 정규식 1회 검사 (패턴에 공백이 없어 경계를 넘는 매치 없음)
+            attrs = f"{node.get('id') or ''} {' '.join(node.get('class') or [])}"
             role = (node.get("role") or "").lower()
-            id_ok = bool(NOISY_PATTERNS.search(str(node_id)))
-            cls_ok = any(NOISY_PATTERNS.search(str(c)) for c in cls)
-            role_ok = role in {"banner", "complementary", "navigation"}
+            if NOISY_PATTERNS.search(attrs) or role in NOISY_ROLES:
+                to_kill.append(node)
+                killed.add(id(node))
+                continue
             text_len = len(node.get_text(strip=True) or "")
+            if not text_len:
+                # 텍스트가 없으면 링크 밀도 0 (링크 길이 계산 생략)
+                continue
             link_len = sum(len(a.get_text(strip=True) or "") for a in node.find_all("a"))
-            link_dense = (link_len / max(1, text_len)) if text_len else 0.0
-            if id_ok or cls_ok or role_ok or link_dense > 0.5:
-                node.decompose()
+            if link_len / text_len > 0.5:
+                to_kill.append(node)
+                killed.add(id(node))
         except Exception:
             continue
+    for node in to_kill:
+        try:
+            node.decompose()
+        except Exception:
+            pass
 
 def _get_text_from_container(node: BeautifulSoup) -> str:
     ps = node.find_all("p")
@@ -203,102 +281,106 @@ def _get_text_from_container(node: BeautifulSoup) -> str:
         parts = [p.get_text(" ", strip=True) for p in ps]
         parts = [t for t in parts if t and len(t) > 3]
         return " ".join(parts)
-    for br in node.find_all("br"):
-        br.replace_with("\n")
+    # <br>을 "\n"으로 바꿔도 strip=True에서 빈 문자열로 버려지므로 트리 수정 없이 바로 추출
     return node.get_text(" ", strip=True)
 
-def post_cleanup_text(text: str) -> str:
+_WS_BEFORE_NL_RE = re.compile(r"\s+\n")
+_WS2_RE = re.compile(r"\s{2,}")
+
+def _clean_lines(text: str, mode: str = "strict") -> str:
+    """
+    본문 줄 단위 정리 (한 번의 순회로 이메일/URL/공백 정리)
+    
+    mode:
+        strict: 잡음 줄 제거, 문단 사이를 빈 줄로 구분
+        broadcast, light: 모든 줄 유지, 연속된 빈 줄은 하나로
+    """
     text = text.replace("\xa0", " ").replace("\u200b", "")
-    text = re.sub(r"\s+\n", "\n", text)
-    lines = [ln.strip() for ln in text.splitlines()]
+    text = _WS_BEFORE_NL_RE.sub("\n", text)
+    strict = mode == "strict"
     kept: List[str] = []
-    for ln in lines:
-        if _line_is_noise(ln):
+    for ln in text.splitlines():
+        if strict and _line_is_noise(ln):
             continue
-        ln = EMAIL_RE.sub("", ln)
-        ln = URL_RE.sub("", ln)
-        ln = re.sub(r"\s{2,}", " ", ln).strip()
+        ln = _WS2_RE.sub(" ", URL_RE.sub("", EMAIL_RE.sub("", ln))).strip()
         if ln:
             kept.append(ln)
-    out = "\n\n".join(kept)
-    out = re.sub(r"\n{3,}", "\n\n", out).strip()
-    return out
+        elif not strict and kept and kept[-1]:
+            kept.append("")
+    if kept and not kept[-1]:
+        kept.pop()
+    return ("\n\n" if strict else "\n").join(kept)
+
+def post_cleanup_text(text: str) -> str:
+    return _clean_lines(text, "strict")
 
 def post_cleanup_text_broadcast(text: str) -> str:
-    text = text.replace("\xa0", " ").replace("\u200b", "")
-    text = re.sub(r"\s+\n", "\n", text)
-    lines = []
-    for ln in text.splitlines():
-        ln = EMAIL_RE.sub("", ln)
-        ln = URL_RE.sub("", ln)
-        ln = re.sub(r"\s{2,}", " ", ln).strip()
-        lines.append(ln)
-    out = "\n".join([x for x in lines if x is not None])
-    out = re.sub(r"\n{3,}", "\n\n", out).strip()
-    return out
+    return _clean_lines(text, "broadcast")
 
 def post_cleanup_text_light(text: str) -> str:
-    text = text.replace("\xa0", " ").replace("\u200b", "")
-    text = re.sub(r"\s+\n", "\n", text)
-    lines = []
-    for ln in text.splitlines():
-        if not ln.strip():
-            lines.append("")
-            continue
-        ln = EMAIL_RE.sub("", ln)
-        ln = URL_RE.sub("", ln)
-        ln = re.sub(r"\s{2,}", " ", ln).strip()
-        lines.append(ln)
-    out = "\n".join(lines)
-    out = re.sub(r"\n{3,}", "\n\n", out).strip()
-    return out
+    return _clean_lines(text, "light")
 
 
 # ─────────────────────────────────────────────────────────────
 # 제목 추출 & 유사도
 # ─────────────────────────────────────────────────────────────
 
-GENERIC_TITLE_PATTERNS = [
-    r"^\s*경향\s*신문\s*$", r"^\s*경향신문\s*$", r"^\s*The\s+Kyunghyang\s+Shinmun\s*$",
-    r"^\s*한겨레\s*$", r"^\s*Hankyoreh\s*$",
-    r"^\s*SBS\s*뉴스\s*$", r"^\s*KBS\s*뉴스\s*$", r"^\s*MBC\s*뉴스\s*$",
-    r"^\s*조선일보\s*$", r"^\s*중앙일보\s*$", r"^\s*동아일보\s*$",
-    r"^\s*국민일보\s*$", r"^\s*Chosun\s*Ilbo\s*$", r"^\s*JoongAng\s*Ilbo\s*$",
-    r"^\s*Donga\s*Ilbo\s*$",
-]
-GENERIC_TITLE_RE = re.compile("|".join(GENERIC_TITLE_PATTERNS), re.IGNORECASE)
+# 언론사 이름만 있는 제목 (연속 공백을 한 칸으로 줄이고 소문자로 비교)
+GENERIC_TITLES = frozenset({
+    "경향 신문", "경향신문", "the kyunghyang shinmun",
+    "한겨레", "hankyoreh",
+    "sbs 뉴스", "sbs뉴스", "kbs 뉴스", "kbs뉴스", "mbc 뉴스", "mbc뉴스",
+    "조선일보", "중앙일보", "동아일보",
+    "국민일보", "chosun ilbo", "chosunilbo", "joongang ilbo", "joongangilbo",
+    "donga ilbo", "dongailbo",
+})
 
 def is_generic_title(title: str, provider: str) -> bool:
     t = (title or "").strip()
     if not t:
         return True
-    if GENERIC_TITLE_RE.match(t):
+    words = t.split()
+    if " ".join(words).lower() in GENERIC_TITLES:
         return True
-    if re.sub(r"\s+", "", t) == re.sub(r"\s+", "", provider or ""):
+    if "".join(words) == "".join((provider or "").split()):
         return True
     if len(t) < 4:
         return True
     return False
 
-def _extract_title_from_html(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    # JSON-LD headline
-    for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
+def _loads_jsonld(data: str) -> Any:
+    if orjson is not None:
         try:
-            data = tag.string or tag.text
-            if not data:
-                continue
-            jd = json.loads(data)
-            objs = [jd] if isinstance(jd, dict) else (jd if isinstance(jd, list) else [])
-            if isinstance(jd, dict) and "@graph" in jd and isinstance(jd["@graph"], list):
-                objs += jd["@graph"]
-            for obj in objs:
-                if isinstance(obj, dict):
-                    headline = obj.get("headline")
-                    if isinstance(headline, str) and headline.strip():
-                        return normalize_text(headline)
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN, 64비트 초과 정수 등 표준 json만 허용하는 입력은 아래에서 다시 시도
+            pass
+    return json.loads(data)
+
+def _parse_jsonld(html: str) -> List[Dict]:
+    """JSON-LD 블록의 객체 목록 (@graph 포함, 파싱 실패 블록은 무시)"""
+    objs: List[Dict] = []
+    for data in JSONLD_RE.findall(html):
+        try:
+            jd = _loads_jsonld(data)
         except Exception:
             continue
+        items = [jd] if isinstance(jd, dict) else (jd if isinstance(jd, list) else [])
+        if isinstance(jd, dict) and isinstance(jd.get("@graph"), list):
+            items = items + jd["@graph"]
+        objs.extend(obj for obj in items if isinstance(obj, dict))
+    return objs
+
+def _extract_title_from_html(html: str, soup: Optional[BeautifulSoup] = None,
+                             jsonld: Optional[List[Dict]] = None) -> str:
+    """페이지 제목 (soup/jsonld가 주어지면 다시 파싱하지 않음, soup은 수정하지 않음)"""
+    # JSON-LD headline
+    for obj in (_parse_jsonld(html) if jsonld is None else jsonld):
+        headline = obj.get("headline")
+        if isinstance(headline, str) and headline.strip():
+            return normalize_text(headline)
+    if soup is None:
+        soup = BeautifulSoup(html, HTML_PARSER)
     # twitter:title
     tw = soup.find("meta", attrs={"name": "twitter:title"})
     if tw and tw.get("content"):
@@ -316,11 +398,17 @@ def _extract_title_from_html(html: str) -> str:
         return normalize_text(soup.title.get_text(" ", strip=True))
     return ""
 
+TITLE_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+@lru_cache(maxsize=512)
+def _title_tokens(x: str) -> FrozenSet[str]:
+    """제목 토큰 (영숫자/한글 연속 구간, 소문자) - 같은 제목이 여러 번 비교되므로 캐시"""
+    return frozenset(t.lower() for t in TITLE_TOKEN_RE.findall(x))
+
 def _title_similarity(a: str, b: str) -> float:
-    def toks(x: str) -> set:
-        x = re.sub(r"[^0-9A-Za-z가-힣 ]", " ", x or "")
-        return set([t for t in x.lower().split() if t])
-    A, B = toks(a), toks(b)
+    if not a or not b:
+        return 0.0
+    A, B = _title_tokens(a), _title_tokens(b)
     if not A or not B:
         return 0.0
     return len(A & B) / len(A | B)
@@ -329,6 +417,24 @@ def _title_similarity(a: str, b: str) -> float:
 # HTML 파싱
 # ─────────────────────────────────────────────────────────────
 
+def _decode_declared_charset(content: bytes) -> Optional[str]:
+    """
+    문서 앞부분 <meta charset> 선언으로 디코딩 (판단이 애매하면 None -> UnicodeDammit)
+    
+    BOM/XML 선언은 UnicodeDammit이 메타 선언보다 우선하므로 넘기고,
+    선언과 실제 바이트가 맞지 않으면(엄격 디코딩 실패) 역시 UnicodeDammit에 맡긴다.
+    """
+    if content.startswith((codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, b"<?xml")):
+        return None
+    m = META_CHARSET_RE.search(content, 0, META_CHARSET_SCAN_BYTES)
+    if not m:
+        return None
+    try:
+        enc = codecs.lookup(m.group(1).decode("ascii")).name
+        return content.decode(enc)
+    except (LookupError, UnicodeDecodeError):
+        return None
+
 def _decode_bytes_safely(content: bytes, headers: dict) -> str:
     ct = (headers.get("Content-Type") or headers.get("content-type") or "").lower()
     if "charset=" in ct:
@@ -337,6 +443,10 @@ def _decode_bytes_safely(content: bytes, headers: dict) -> str:
             return content.decode(enc, errors="replace")
         except Exception:
             pass
+    # <meta charset> 선언이 있으면 UnicodeDammit(느린 추측 과정) 없이 바로 디코딩
+    text = _decode_declared_charset(content)
+    if text is not None:
+        return text
     dammit = UnicodeDammit(content, is_html=True)
     if dammit.unicode_markup:
         return dammit.unicode_markup
@@ -347,58 +457,65 @@ def _decode_bytes_safely(content: bytes, headers: dict) -> str:
             continue
     return content.decode("utf-8", errors="replace")
 
-def _extract_from_html(html: str, url_hint: str = "") -> Optional[str]:
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_looks_broken(soup: BeautifulSoup, html: str) -> bool:
+    """1차 파싱 실패 신호 (body 없음 또는 문서 끝이 잘림)"""
+    return soup.find("body") is None or "</html>" not in html[-512:].lower()
+
+def _extract_from_html(html: str, url_hint: str = "",
+                       soup: Optional[BeautifulSoup] = None,
+                       jsonld: Optional[List[Dict]] = None) -> Optional[str]:
+    """
+    본문 추출 (JSON-LD -> 도메인 선택자 -> itemprop -> article -> 범용 선택자 -> html5lib)
+    
+    soup: 미리 파싱한 문서 (없으면 직접 파싱). 잡음 노드를 지우므로 호출 후 재사용 불가
+    jsonld: _parse_jsonld() 결과 (제목 추출과 공유, 없으면 직접 파싱)
+    """
+    if soup is None:
+        soup = BeautifulSoup(html, HTML_PARSER)
     _strip_noisy_nodes(soup)
-    host = urlparse(url_hint).netloc.lower()
+    host = _url_host(url_hint)
 
-    def _clean(txt: str) -> str:
-        if "imnews.imbc.com" in host or "news.kbs.co.kr" in host:
-            return post_cleanup_text_broadcast(txt)
-        if "khan.co.kr" in host and "/amp" in url_hint:
-            return post_cleanup_text_light(txt)
-        return post_cleanup_text(txt)
+    # 본문 정리 함수는 호스트별로 한 번만 결정
+    if any(h in host for h in BROADCAST_HOSTS):
+        cleaner = post_cleanup_text_broadcast
+    elif "khan.co.kr" in host and "/amp" in url_hint:
+        cleaner = post_cleanup_text_light
+    else:
+        cleaner = post_cleanup_text
 
-    # JSON-LD
+    # JSON-LD (script 태그는 _strip_noisy_nodes에서 제거되므로 원문 HTML에서 추출)
     try:
-        for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
-            data = tag.string or tag.text
-            if not data:
-                continue
-            jd = json.loads(data)
-            objs = [jd] if isinstance(jd, dict) else (jd if isinstance(jd, list) else [])
-            if isinstance(jd, dict) and "@graph" in jd and isinstance(jd["@graph"], list):
-                objs += jd["@graph"]
-            for obj in objs:
-                if not isinstance(obj, dict):
-                    continue
-                tp = obj.get("@type") or obj.get("type") or ""
-                if isinstance(tp, list):
-                    tp = " ".join(tp)
-                if "NewsArticle" in tp or "Article" in tp:
-                    body = obj.get("articleBody") or obj.get("body")
-                    if body and len(body) > 180:
-                        return post_cleanup_text(normalize_text(body))
+        for obj in (_parse_jsonld(html) if jsonld is None else jsonld):
+            tp = obj.get("@type") or obj.get("type") or ""
+            if isinstance(tp, list):
+                tp = " ".join(tp)
+            if "NewsArticle" in tp or "Article" in tp:
+                body = obj.get("articleBody") or obj.get("body")
+                if body and len(body) > 180:
+                    # 정리 후 너무 짧아지면 (금지어 줄 제거 등) 선택자 추출로 넘어감
+                    txt = post_cleanup_text(normalize_text(body))
+                    if len(txt) > 180:
+                        return txt
     except Exception:
         pass
 
     # 도메인 전용
-    if host in DOMAIN_SELECTORS:
-        for sel in DOMAIN_SELECTORS[host]:
-            node = soup.select_one(sel)
+    if host in DOMAIN_SELECTORS_C:
+        for sel in DOMAIN_SELECTORS_C[host]:
+            node = sel.select_one(soup)
             if node and node.get_text(strip=True):
                 _strip_noisy_nodes(node)
                 txt = _get_text_from_container(node)
-                txt = _clean(txt)
+                txt = cleaner(txt)
                 if len(txt) > 180:
                     return txt
 
     # itemprop
-    node = soup.select_one('[itemprop="articleBody"]')
+    node = ITEMPROP_BODY_SEL.select_one(soup)
     if node and node.get_text(strip=True):
         _strip_noisy_nodes(node)
         txt = _get_text_from_container(node)
-        txt = _clean(txt)
+        txt = cleaner(txt)
         if len(txt) > 180:
             return txt
 
@@ -407,44 +524,42 @@ def _extract_from_html(html: str, url_hint: str = "") -> Optional[str]:
     if art and art.get_text(strip=True):
         _strip_noisy_nodes(art)
         txt = _get_text_from_container(art)
-        txt = _clean(txt)
+        txt = cleaner(txt)
         if len(txt) > 180:
             return txt
 
     # 범용 후보
-    for sel in [
-        "div#articleBodyContents", "div#newsEndContents",
-        "div.article_body", "div#articeBody", "div.article",
-        "div#content", "div#contents", ".article-body", ".content"
-    ]:
-        node = soup.select_one(sel)
+    for sel in GENERIC_SELECTORS_C:
+        node = sel.select_one(soup)
         if node and node.get_text(strip=True):
             _strip_noisy_nodes(node)
             txt = _get_text_from_container(node)
-            txt = _clean(txt)
+            txt = cleaner(txt)
             if len(txt) > 180:
                 return txt
 
-    # 2차: html5lib
+    # 2차: html5lib (느리므로 1차 파싱 자체가 깨진 경우에만)
+    if not _parse_looks_broken(soup, html):
+        return None
     try:
         soup_h5 = BeautifulSoup(html, "html5lib")
         _strip_noisy_nodes(soup_h5)
 
-        if host in DOMAIN_SELECTORS:
-            for sel in DOMAIN_SELECTORS[host]:
-                node = soup_h5.select_one(sel)
+        if host in DOMAIN_SELECTORS_C:
+            for sel in DOMAIN_SELECTORS_C[host]:
+                node = sel.select_one(soup_h5)
                 if node and node.get_text(strip=True):
                     _strip_noisy_nodes(node)
                     txt = _get_text_from_container(node)
-                    txt = _clean(txt)
+                    txt = cleaner(txt)
                     if len(txt) > 180:
                         return txt
 
-        node = soup_h5.select_one('[itemprop="articleBody"]')
+        node = ITEMPROP_BODY_SEL.select_one(soup_h5)
         if node and node.get_text(strip=True):
             _strip_noisy_nodes(node)
             txt = _get_text_from_container(node)
-            txt = _clean(txt)
+            txt = cleaner(txt)
             if len(txt) > 180:
                 return txt
 
@@ -452,7 +567,7 @@ def _extract_from_html(html: str, url_hint: str = "") -> Optional[str]:
         if art and art.get_text(strip=True):
             _strip_noisy_nodes(art)
             txt = _get_text_from_container(art)
-            txt = _clean(txt)
+            txt = cleaner(txt)
             if len(txt) > 180:
                 return txt
     except Exception:
@@ -485,18 +600,18 @@ def make_rewrite_candidates(url: str) -> List[str]:
             if nid:
                 cand.append(f"https://news.sbs.co.kr/amp/news.amp?news_id={nid}")
 
+        q_sep = query + "&" if query else ""
+
         # 중앙 AMP
         if "joongang.co.kr" in host or "joins.com" in host:
-            q_amp = query + ("&" if query else "") + "view=amp"
-            cand.append(_with(query_new=q_amp))
+            cand.append(_with(query_new=q_sep + "view=amp"))
 
         # KMIB
         if "kmib.co.kr" in host:
             cand.append(_with(host_new="m.kmib.co.kr"))
             cand.append(_with(host_new="news.kmib.co.kr"))
             cand.append(_with(host_new="amp.kmib.co.kr"))
-            q_amp = query + ("&" if query else "") + "view=amp"
-            cand.append(_with(query_new=q_amp))
+            cand.append(_with(query_new=q_sep + "view=amp"))
 
         # 조선
         if "chosun.com" in host:
@@ -518,87 +633,131 @@ def make_rewrite_candidates(url: str) -> List[str]:
         # 한겨레
         if "hani.co.kr" in host:
             cand.append(_with(host_new="m.hani.co.kr"))
-            q_m = query + ("&" if query else "") + "m=1"
-            cand.append(_with(query_new=q_m))
+            cand.append(_with(query_new=q_sep + "m=1"))
 
         # 경향
         if "khan.co.kr" in host:
             if not path.endswith("/amp"):
                 cand.append(_with(path_new=(path.rstrip("/") + "/amp")))
             cand.append(_with(host_new="m.khan.co.kr"))
-            q_amp = query + ("&" if query else "") + "output=amp"
-            cand.append(_with(query_new=q_amp))
+            cand.append(_with(query_new=q_sep + "output=amp"))
 
     except Exception:
         pass
 
-    # 중복 제거
-    uniq, seen = [], set()
-    for c in cand:
-        if c and c not in seen:
-            uniq.append(c); seen.add(c)
-    return uniq
+    # 중복 제거 (순서 유지)
+    return [c for c in dict.fromkeys(cand) if c]
 
 # ─────────────────────────────────────────────────────────────
 # 원문 크롤링
 # ─────────────────────────────────────────────────────────────
 
-def crawl_article(url: str, timeout: int = 15) -> Optional[Tuple[str, str]]:
-    """성공 시 (본문, 페이지제목) 반환"""
-    try:
-        candidates = make_rewrite_candidates(url)
-
-        for i, u in enumerate(candidates):
-            if i > 0:
-                print(f"  ↳ REWRITE TRY[{i}]: {u}")
-            time.sleep(random.uniform(0.6, 1.2))
+@lru_cache(maxsize=2048)
+def _url_host(u: str) -> str:
+    """소문자 호스트 (urlparse(u).netloc.lower()와 같음, 단순한 http(s) URL은 split으로 처리)"""
+    if u.startswith(("http://", "https://")):
+        netloc = u.split("/", 3)[2]
+        if not any(ch in netloc for ch in "?#\t\r\n"):
+            return netloc.lower()
+    return urlparse(u).netloc.lower()
+
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+def _host_slot(host: str) -> threading.BoundedSemaphore:
+    """호스트별 동시 요청 제한 (병렬 크롤링 중에도 같은 사이트에 몰리지 않도록)"""
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(PER_HOST_CONCURRENCY)
+        return slot
+
+def _polite_get(u: str, timeout: int, delay: Tuple[float, float],
+                host: Optional[str] = None) -> requests.Response:
+    with _host_slot(host if host is not None else _url_host(u)):
+        time.sleep(random.uniform(*delay))
+        return _session().get(u, timeout=(CONNECT_TIMEOUT, timeout))
+
+def _is_error_page(host: str, html: str) -> bool:
+    """200으로 응답하지만 실제로는 오류 안내인 페이지"""
+    # MBC 방어
+    if "imnews.imbc.com" in host:
+        low = html.lower()
+        if ("요청하신 페이지를 찾을 수 없습니다" in html) or ("class=\"error\"" in low and "mbc" in low):
+            return True
+    return False
 
-            if urlparse(u).netloc.lower() in DENY_FALLBACK_HOSTS:
-                print(f"  ↳ FALLBACK DISABLED for host={urlparse(u).netloc}")
-                continue
+def _fetch_candidate(i: int, u: str, timeout: int) -> Optional[Tuple[str, str]]:
+    """후보 URL 1개 요청 + 본문 추출 (실패 시 None)"""
+    if i > 0:
+        logger.info(f"  ↳ REWRITE TRY[{i}]: {u}")
 
-            r = requests.get(u, headers=REQ_HEADERS, timeout=timeout)
-            print(f"  ↳ GET {u} status={r.status_code}")
-            if r.status_code != 200 or not r.content:
-                continue
-            html = _decode_bytes_safely(r.content, r.headers)
+    host = _url_host(u)
+    if host in DENY_FALLBACK_HOSTS:
+        logger.info(f"  ↳ FALLBACK DISABLED for host={host}")
+        return None
 
-            # MBC 방어
-            if "imnews.imbc.com" in urlparse(u).netloc.lower():
-                low = html.lower()
-                if ("요청하신 페이지를 찾을 수 없습니다" in html) or ("class=\"error\"" in low and "mbc" in low):
-                    continue
+    try:
+        r = _polite_get(u, timeout, (0.6, 1.2), host=host)
+    except requests.RequestException as e:
+        logger.warning(f"  ↳ GET ERROR: {e}")
+        return None
+    logger.info(f"  ↳ GET {u} status={r.status_code}")
+    if r.status_code != 200 or not r.content:
+        return None
+    html = _decode_bytes_safely(r.content, r.headers)
+    if _is_error_page(host, html):
+        return None
 
-            body = _extract_from_html(html, url_hint=u)
-            if body:
-                page_title = _extract_title_from_html(html)
-                print(f"  ↳ EXTRACT OK len={len(body)}")
-                return body, page_title
-
-            # AMP 재시도
-            try:
-                soup_tmp = BeautifulSoup(html, "html.parser")
-                amp = soup_tmp.find("link", rel=lambda v: v and "amphtml" in v.lower())
-                if amp and amp.get("href"):
-                    amp_url = requests.compat.urljoin(u, amp["href"])
-                    print(f"  ↳ AMP TRY: {amp_url}")
-                    time.sleep(random.uniform(0.5, 1.0))
-                    r2 = requests.get(amp_url, headers=REQ_HEADERS, timeout=timeout)
-                    if r2.status_code == 200 and r2.content:
-                        html2 = _decode_bytes_safely(r2.content, r2.headers)
-                        body2 = _extract_from_html(html2, url_hint=amp_url)
-                        if body2:
-                            page_title2 = _extract_title_from_html(html2)
-                            print(f"  ↳ EXTRACT OK (AMP) len={len(body2)}")
-                            return body2, page_title2
-            except Exception:
-                pass
+    # 한 번 파싱한 문서로 제목 -> AMP 링크 -> 본문 순서로 추출 (본문 추출이 노드를 지우므로)
+    soup = BeautifulSoup(html, HTML_PARSER)
+    jsonld = _parse_jsonld(html)
+    page_title = _extract_title_from_html(html, soup=soup, jsonld=jsonld)
+    amp = (soup.head or soup).find("link", rel=lambda v: v and "amphtml" in v.lower())
+    body = _extract_from_html(html, url_hint=u, soup=soup, jsonld=jsonld)
+    if body:
+        logger.info(f"  ↳ EXTRACT OK len={len(body)}")
+        return body, page_title
+
+    # AMP 재시도
+    try:
+        if amp and amp.get("href"):
+            amp_url = requests.compat.urljoin(u, amp["href"])
+            logger.info(f"  ↳ AMP TRY: {amp_url}")
+            r2 = _polite_get(amp_url, timeout, (0.5, 1.0))
+            if r2.status_code == 200 and r2.content:
+                html2 = _decode_bytes_safely(r2.content, r2.headers)
+                soup2 = BeautifulSoup(html2, HTML_PARSER)
+                jsonld2 = _parse_jsonld(html2)
+                page_title2 = _extract_title_from_html(html2, soup=soup2, jsonld=jsonld2)
+                body2 = _extract_from_html(html2, url_hint=amp_url, soup=soup2, jsonld=jsonld2)
+                if body2:
+                    logger.info(f"  ↳ EXTRACT OK (AMP) len={len(body2)}")
+                    return body2, page_title2
+    except Exception:
+        pass
 
-        return None
+    return None
 
-    except requests.RequestException as e:
-        print(f"  ↳ GET ERROR: {e}")
+def crawl_article(url: str, timeout: int = 15) -> Optional[Tuple[str, str]]:
+    """
+    성공 시 (본문, 페이지제목) 반환
+    
+    리라이트 후보(모바일/AMP 등)를 동시에 요청하되, 결과는 후보 순서대로 확인해
+    앞선 후보가 성공하면 그 결과를 쓴다 (순차 시도와 같은 우선순위).
+    """
+    candidates = make_rewrite_candidates(url)
+    pool = ThreadPoolExecutor(max_workers=max(1, min(CANDIDATE_WORKERS, len(candidates))))
+    try:
+        futures = [pool.submit(_fetch_candidate, i, u, timeout) for i, u in enumerate(candidates)]
+        for fut in futures:
+            result = fut.result()
+            if result:
+                return result
         return None
+    finally:
+        # 성공 후 남은 후보는 시작 전이면 취소, 진행 중이면 기다리지 않음
+        pool.shutdown(wait=False, cancel_futures=True)
 
 # ─────────────────────────────────────────────────────────────
 # KINDS API
@@ -610,19 +769,26 @@ def kinds_fetch_news_detail(news_ids: List[str], fields: Optional[List[str]] = N
     if fields:
         argument["fields"] = fields
     payload = {"access_key": Config.KINDS_ACCESS_KEY, "argument": argument}
-    r = requests.post(url, json=payload, headers=KINDS_HEADERS, timeout=20)
+    r = kinds_session().post(url, json=payload, timeout=(CONNECT_TIMEOUT, 20))
     r.raise_for_status()
     return r.json()
 
+def _url_key(url: str) -> str:
+    """중복 판별용 URL (스킴/호스트 소문자, 프래그먼트·끝 슬래시 제거, 쿼리는 기사 ID일 수 있어 유지)"""
+    if not url:
+        return ""
+    p = urlparse(url.strip())
+    return urlunparse(("", p.netloc.lower(), p.path.rstrip("/"), p.params, p.query, ""))
+
 def looks_truncated(text: str) -> bool:
     if not text:
         return True
     if len(text) < Config.MIN_REASONABLE_LEN:
         return True
     tail = text.strip()[-40:]
-    if not SENTENCE_END_RE.search(tail):
-        return True
-    return False
+    if tail and tail[-1] in SENTENCE_END_CHARS:
+        return False
+    return not SENTENCE_END_RE.search(tail)
 
 # ─────────────────────────────────────────────────────────────
 # 메인: 기사 크롤링
@@ -639,88 +805,167 @@ def crawl_articles(issue_obj: Dict[str, Any], per_topic_docs: int = 1) -> List[D
     Returns:
         기사 데이터 리스트
     """
-    print(f"\n📝 기사 크롤링 시작...")
+    logger.info(f"\n📝 기사 크롤링 시작...")
     
     topics = issue_obj.get("topics", [])
     out: List[Dict] = []
+    # 토픽 간 중복 기사 (news_id / URL -> 먼저 수집된 기사)
+    seen: Dict[str, Dict] = {}
+
+    # 네트워크 작업(KINDS 상세 조회, 잘린 본문 원문 크롤링)은 미리 병렬로 시작하고,
+    # 선별/중복 제거는 기존과 같이 토픽 순서대로 처리
+    pool = ThreadPoolExecutor(max_workers=Config.CRAWL_WORKERS)
+    try:
+        clusters = [(t, (t.get("news_cluster") or [])[:per_topic_docs]) for t in topics]
+        docs_by_topic = _fetch_docs_by_topic(pool, [cluster for _, cluster in clusters])
+        fallback_futs: Dict[str, Future] = {}
+
+        def _prefetch_fallbacks(docs: List[Dict]) -> List[Tuple[Dict, str, str]]:
+            prepared = []
+            for d in docs:
+                url = d.get("provider_link_page") or d.get("url") or d.get("link") or ""
+                body = normalize_text(d.get("content_original") or d.get("content") or "")
+                prepared.append((d, url, body))
+                provider = d.get("provider","") or ""
+                if SAVE_ONLY_PROVIDERS and provider not in SAVE_ONLY_PROVIDERS:
+                    continue
+                if _needs_fallback(url, body) and _url_key(url) not in fallback_futs:
+                    fallback_futs[_url_key(url)] = pool.submit(crawl_article, url)
+            return prepared
 
-    for t in topics:
-        topic_name = t.get("topic")
-        topic_rank = t.get("topic_rank")
-        cluster = (t.get("news_cluster") or [])[:per_topic_docs]
+        # 잘린 본문의 폴백 크롤링을 전부 예약한 뒤 선별 시작
+        prepared_by_topic = [_prefetch_fallbacks(docs) for docs in docs_by_topic]
+
+        for (t, requested), prepared in zip(clusters, prepared_by_topic):
+            out.extend(_select_topic_articles(t, requested, prepared, fallback_futs, seen))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    logger.info(f"✅ 크롤링 완료: {len(out)}개 기사")
+    return out
+
+def _fetch_docs_by_topic(pool: ThreadPoolExecutor, clusters: List[List[str]]) -> List[List[Dict]]:
+    """
+    모든 토픽의 news_id를 모아 KINDS 상세 조회 (토픽마다 요청하지 않고 KINDS_BATCH_SIZE개씩)
+    
+    Returns:
+        토픽별 문서 리스트 (clusters와 같은 순서, 문서는 응답 순서 유지)
+    """
+    # news_id -> 해당 기사를 요청한 토픽 번호 (여러 토픽에 속한 기사는 각 토픽에 전달)
+    topic_idx: Dict[str, List[int]] = {}
+    for i, cluster in enumerate(clusters):
+        for nid in cluster:
+            owners = topic_idx.setdefault(nid, [])
+            if i not in owners:
+                owners.append(i)
+
+    ids = list(topic_idx)
+    batches = [ids[k:k + KINDS_BATCH_SIZE] for k in range(0, len(ids), KINDS_BATCH_SIZE)]
+    docs_by_topic: List[List[Dict]] = [[] for _ in clusters]
+    for docs in pool.map(_fetch_docs, batches):
+        for d in docs:
+            for i in topic_idx.get(d.get("news_id"), ()):
+                docs_by_topic[i].append(d)
+    return docs_by_topic
+
+def _fetch_docs(news_ids: List[str]) -> List[Dict]:
+    detail = kinds_fetch_news_detail(
+        news_ids=news_ids,
+        fields=["news_id","title","content","content_original","provider",
+               "published_at","provider_link_page","url","link","byline","category"]
+    )
+    return (detail.get("return_object", {}) or {}).get("documents", []) or []
+
+def _needs_fallback(url: str, body: str) -> bool:
+    return bool(looks_truncated(body) and url and _url_host(url) not in DENY_FALLBACK_HOSTS)
+
+def _mark_duplicate(seen: Dict[str, Dict], key: str, topic_name: str) -> bool:
+    """이미 수집된 기사면 토픽만 추가하고 True"""
+    art = seen.get(key)
+    if art is None:
+        return False
+    if topic_name not in art["topics"]:
+        art["topics"].append(topic_name)
+    logger.info(f"  ↳ SKIP: 중복 기사 ({key[:40]})")
+    return True
+
+def _select_topic_articles(t: Dict, requested: List[str], prepared: List[Tuple[Dict, str, str]],
+                           fallback_futs: Dict[str, Future], seen: Dict[str, Dict]) -> List[Dict]:
+    """토픽 1개의 기사 선별 (중복/언론사/본문 길이 검사, 폴백 본문 적용)"""
+    out: List[Dict] = []
+    topic_name = t.get("topic")
+    topic_rank = t.get("topic_rank")
+    cluster = [nid for nid in requested if not _mark_duplicate(seen, nid, topic_name)]
+    
+    if not cluster:
+        return out
+    # 앞선 토픽에서 이미 수집된 기사
+    removed = set(requested) - set(cluster)
+
+    for d, url, body_kinds in prepared:
+        if d.get("news_id") in removed:
+            continue
+        title = d.get("title","") or ""
+        provider = d.get("provider","") or ""
         
-        if not cluster:
+        if SAVE_ONLY_PROVIDERS and provider not in SAVE_ONLY_PROVIDERS:
+            logger.info(f"  ↳ SKIP: provider={provider}")
+            continue
+            
+        category = d.get("category","") or ""
+        published_at = d.get("published_at","") or ""
+        url_key = _url_key(url)
+        if url_key and _mark_duplicate(seen, url_key, topic_name):
             continue
 
-        detail = kinds_fetch_news_detail(
-            news_ids=cluster,
-            fields=["news_id","title","content","content_original","provider",
-                   "published_at","provider_link_page","url","link","byline","category"]
-        )
-        
-        docs = (detail.get("return_object", {}) or {}).get("documents", [])
-        if not docs:
+        final_body = body_kinds
+        final_title = title
+        used_fallback = False
+
+        # 잘림 감지 → 폴백
+        if _needs_fallback(url, final_body):
+            fut = fallback_futs.get(url_key)
+            crawled = fut.result() if fut is not None else crawl_article(url)
+            if crawled:
+                crawled_body, crawled_title = crawled
+                if len(crawled_body) > len(final_body) or \
+                   (len(final_body) <= 250 and len(crawled_body) >= 400):
+                    used_fallback = True
+                    final_body = normalize_text(crawled_body)
+
+                    sim = _title_similarity(title, crawled_title or "")
+                    if sim < 0.35 and is_generic_title(crawled_title or "", provider):
+                        logger.info(f"  ↳ SKIP: 제목 미스매치 & 폴백 제목이 매체명")
+                        continue
+                    
+                    if crawled_title and not is_generic_title(crawled_title, provider) and sim < 0.35:
+                        final_title = crawled_title
+
+        # 폴백 실패 & 본문 짧음 → 스킵
+        if not used_fallback and len(final_body) <= Config.MIN_KINDS_LEN_TO_SAVE_IF_NO_FALLBACK:
+            logger.info(f"  ↳ SKIP: 폴백 실패 & 본문 짧음")
             continue
 
-        for d in docs:
-            title = d.get("title","") or ""
-            provider = d.get("provider","") or ""
-            
-            if SAVE_ONLY_PROVIDERS and provider not in SAVE_ONLY_PROVIDERS:
-                print(f"  ↳ SKIP: provider={provider}")
-                continue
-                
-            category = d.get("category","") or ""
-            published_at = d.get("published_at","") or ""
-            url = d.get("provider_link_page") or d.get("url") or d.get("link") or ""
-
-            # KINDS 본문
-            body_kinds_raw = d.get("content_original") or d.get("content") or ""
-            body_kinds = normalize_text(body_kinds_raw)
-
-            final_body = body_kinds
-            final_title = title
-            used_fallback = False
-
-            # 잘림 감지 → 폴백
-            if looks_truncated(final_body):
-                if url and urlparse(url).netloc.lower() not in DENY_FALLBACK_HOSTS:
-                    crawled = crawl_article(url)
-                    if crawled:
-                        crawled_body, crawled_title = crawled
-                        if len(crawled_body) > len(final_body) or \
-                           (len(final_body) <= 250 and len(crawled_body) >= 400):
-                            used_fallback = True
-                            final_body = normalize_text(crawled_body)
-
-                            sim = _title_similarity(title, crawled_title or "")
-                            if sim < 0.35 and is_generic_title(crawled_title or "", provider):
-                                print(f"  ↳ SKIP: 제목 미스매치 & 폴백 제목이 매체명")
-                                continue
-                            
-                            if crawled_title and not is_generic_title(crawled_title, provider) and sim < 0.35:
-                                final_title = crawled_title
-
-            # 폴백 실패 & 본문 짧음 → 스킵
-            if not used_fallback and len(final_body) <= Config.MIN_KINDS_LEN_TO_SAVE_IF_NO_FALLBACK:
-                print(f"  ↳ SKIP: 폴백 실패 & 본문 짧음")
-                continue
+        logger.info(f"[{topic_name}] '{final_title[:30]}...' ({provider}) ✅")
+
+        art = {
+            "topic": topic_name,
+            "topics": [topic_name],
+            "topic_rank": topic_rank,
+            "news_id": d.get("news_id",""),
+            "title": final_title,
+            "provider": provider,
+            "category": category,
+            "published_at": clean_date(published_at),
+            "url": url,
+            "content": final_body,
+            "source": "fallback" if used_fallback else "kinds"
+        }
+        out.append(art)
+        for key in (art["news_id"], url_key):
+            if key:
+                seen[key] = art
 
-            print(f"[{topic_name}] '{final_title[:30]}...' ({provider}) ✅")
-
-            out.append({
-                "topic": topic_name,
-                "topic_rank": topic_rank,
-                "news_id": d.get("news_id",""),
-                "title": final_title,
-                "provider": provider,
-                "category": category,
-                "published_at": clean_date(published_at),
-                "url": url,
-                "content": final_body,
-                "source": "fallback" if used_fallback else "kinds"
-            })
-
-    print(f"✅ 크롤링 완료: {len(out)}개 기사")
     return out
 
+
@@ -3,57 +3,300 @@
 """
 
 import os
+import logging
 import json
 import base64
+import threading
 import torch
 from openai import OpenAI
 from transformers import AutoTokenizer, AutoModelForCausalLM
-from typing import List, Dict
+from typing import List, Dict, Sequence
 from config import Config
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    from awq import AutoAWQForCausalLM
+except ImportError:  # autoawq 미설치 시 fp16 모델 사용
+    AutoAWQForCausalLM = None
+
+try:
+    import vllm
+except ImportError:  # vLLM 미설치 시 transformers generate 사용
+    vllm = None
+
+logger = logging.getLogger(__name__)
+
+# OpenAI 클라이언트 (싱글톤, HTTP 연결 풀을 기사 간 재사용)
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+def get_openai_client():
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            # 429/5xx는 SDK 내장 지수 백오프로 재시도
+            _openai_client = OpenAI(api_key=Config.OPENAI_API_KEY, max_retries=5)
+    return _openai_client
+
 # Llama 모델 초기화 (싱글톤)
+LLAMA_MODEL_ID = "meta-llama/Llama-3.1-8B-Instruct"
+LLAMA_AWQ_MODEL_ID = "hugging-quants/Meta-Llama-3.1-8B-Instruct-AWQ-INT4"
+LLAMA_SEED = 102  # 프롬프트/퀴즈 샘플링 시드
 _llama_model = None
 _llama_tokenizer = None
+# AWQ 융합 모듈 사용 여부 (융합 어텐션은 자체 causal 마스크만 써서 패딩 마스크를 무시함)
+_llama_fused = False
+# 로딩/생성은 GPU를 공유하므로 스레드 간 직렬화
+_llama_lock = threading.Lock()
 
 def get_llama_model():
-    global _llama_model, _llama_tokenizer
-    if _llama_model is None:
-        from huggingface_hub import login
-        
-        if Config.HUGGINGFACE_TOKEN:
-            try:
-                login(Config.HUGGINGFACE_TOKEN)
-            except Exception:
-                pass
-        
-        model_id = "meta-llama/Llama-3.1-8B-Instruct"
-        print(f"🦙 Llama 모델 로딩 중...")
-        
-        _llama_tokenizer = AutoTokenizer.from_pretrained(
-            model_id, 
-            use_fast=True, 
-            token=Config.HUGGINGFACE_TOKEN
-        )
-        
-        if _llama_tokenizer.pad_token is None:
-            _llama_tokenizer.pad_token = _llama_tokenizer.eos_token
-        
-        _llama_model = AutoModelForCausalLM.from_pretrained(
-            model_id,
-            torch_dtype=torch.float16,
-            device_map="auto",
-            token=Config.HUGGINGFACE_TOKEN
-        )
+    global _llama_model, _llama_tokenizer, _llama_fused
+    with _llama_lock:
+        if _llama_model is None:
+            from huggingface_hub import login
+            
+            if Config.HUGGINGFACE_TOKEN:
+                try:
+                    login(Config.HUGGINGFACE_TOKEN)
+                except Exception:
+                    pass
+            
+            # AWQ INT4 가중치(W4A16)는 CUDA에서만 사용 (디코딩이 가중치 대역폭 병목이라 약 2배 빠름)
+            use_awq = AutoAWQForCausalLM is not None and torch.cuda.is_available()
+            model_id = LLAMA_AWQ_MODEL_ID if use_awq else LLAMA_MODEL_ID
+            logger.info(f"🦙 Llama 모델 로딩 중... ({'AWQ INT4' if use_awq else 'fp16'})")
+            
+            _llama_tokenizer = AutoTokenizer.from_pretrained(
+                model_id, 
+                use_fast=True, 
+                token=Config.HUGGINGFACE_TOKEN
+            )
+            
+            if _llama_tokenizer.pad_token is None:
+                _llama_tokenizer.pad_token = _llama_tokenizer.eos_token
+            # 배치 생성 시 새 토큰이 모든 행에서 같은 위치부터 시작하도록 왼쪽 패딩
+            _llama_tokenizer.padding_side = "left"
+            
+            if use_awq:
+                # 융합 GEMM 커널 사용 (비융합 AWQ는 fp16보다 느릴 수 있음)
+                # 융합 모듈은 패딩 마스크를 무시하므로 한 행씩 생성 (KV 캐시도 배치 1로 잡음)
+                _llama_model = AutoAWQForCausalLM.from_quantized(
+                    model_id,
+                    fuse_layers=True,
+                    safetensors=True,
+                    batch_size=1,
+                ).model
+                _llama_fused = True
+            else:
+                _llama_model = AutoModelForCausalLM.from_pretrained(
+                    model_id,
+                    torch_dtype=torch.float16,
+                    device_map="auto",
+                    token=Config.HUGGINGFACE_TOKEN
+                )
     
     return _llama_model, _llama_tokenizer
 
+# vLLM 엔진 (싱글톤, CUDA + vllm 설치 시 사용)
+_vllm_engine = None
+_vllm_checked = False
+
+def get_vllm_engine():
+    """
+    vLLM 엔진 (CUDA 그래프 + 공통 시스템 프롬프트 prefix 캐시, 기사 간 재사용)
+    
+    Returns:
+        vllm.LLM (사용 불가 시 None, transformers 모델로 대체)
+    """
+    global _vllm_engine, _vllm_checked
+    with _llama_lock:
+        if not _vllm_checked:
+            _vllm_checked = True
+            if vllm is not None and torch.cuda.is_available():
+                logger.info(f"🦙 Llama vLLM 엔진 로딩 중...")
+                # 요약 모델과 GPU를 나눠 쓰므로 메모리 사용률 제한
+                _vllm_engine = vllm.LLM(
+                    model=LLAMA_AWQ_MODEL_ID,
+                    quantization="awq",
+                    enforce_eager=False,
+                    enable_prefix_caching=True,
+                    gpu_memory_utilization=0.6,
+                    seed=LLAMA_SEED,
+                )
+    return _vllm_engine
+
+def get_llama_tokenizer():
+    """채팅 템플릿용 토크나이저 (사용 중인 추론 백엔드의 것)"""
+    engine = get_vllm_engine()
+    if engine is not None:
+        return engine.get_tokenizer()
+    return get_llama_model()[1]
+
+def _render_chat(tokenizer, system: str, user: str) -> str:
+    """시스템/사용자 메시지 1쌍을 채팅 템플릿 문자열로 (생성 프롬프트 포함)"""
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user}
+    ]
+    return tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+
+def _generate_texts(chats: List[str], max_new_tokens: Sequence[int]) -> List[str]:
+    """
+    채팅 문자열 배치를 한 번에 생성
+    
+    Args:
+        chats: apply_chat_template(tokenize=False) 결과
+        max_new_tokens: 행별 새 토큰 상한
+    
+    Returns:
+        행별 생성 텍스트 (앞뒤 공백 제거)
+    """
+    sampling = dict(temperature=0.7, top_p=0.9, repetition_penalty=1.05)
+    
+    engine = get_vllm_engine()
+    if engine is not None:
+        params = [vllm.SamplingParams(max_tokens=n, seed=LLAMA_SEED, **sampling) for n in max_new_tokens]
+        with _llama_lock:
+            outs = engine.generate(chats, params, use_tqdm=False)
+        return [o.outputs[0].text.strip() for o in outs]
+    
+    # 요청들은 서로 독립이므로 왼쪽 패딩으로 묶어 generate 1회로 디코딩
+    # (8B 디코딩은 가중치 대역폭이 병목이라 배치 2의 비용이 배치 1과 거의 같음)
+    # 단, AWQ 융합 모듈은 패딩 attention_mask를 무시해 짧은 행이 패딩 토큰을 보게 되므로 한 행씩 생성
+    # 공통 prefix의 KV 재사용은 vLLM prefix 캐시에 맡긴다: 프롬프트/퀴즈는 시스템 메시지가 달라
+    # 공유 구간이 템플릿 머리뿐이고, 왼쪽 패딩 배치나 AWQ 융합 모듈(자체 KV 캐시)에는
+    # past_key_values를 넘길 수 없다
+    model, tokenizer = get_llama_model()
+    batches = [[i] for i in range(len(chats))] if _llama_fused else [list(range(len(chats)))]
+    texts = [""] * len(chats)
+    
+    # transformers 4.35 generate는 generator 인자를 받지 않으므로, 잠금 안에서 전역 RNG를
+    # 잠시 분기해 시드를 고정 (호출이 끝나면 다른 스레드/모듈의 RNG 상태는 그대로)
+    with _llama_lock, torch.no_grad(), torch.random.fork_rng():
+        torch.manual_seed(LLAMA_SEED)
+        for rows in batches:
+            inputs = tokenizer([chats[i] for i in rows], return_tensors="pt", padding=True).to(model.device)
+            limits = [max_new_tokens[i] for i in rows]
+            out = model.generate(
+                **inputs,
+                do_sample=True,
+                max_new_tokens=max(limits),
+                pad_token_id=tokenizer.pad_token_id,
+                eos_token_id=tokenizer.eos_token_id,
+                **sampling,
+            )
+            
+            # 행별 새 토큰 상한은 배치 최대값으로 생성한 뒤 잘라서 적용
+            prompt_len = inputs["input_ids"].shape[-1]
+            for i, row, limit in zip(rows, out, limits):
+                texts[i] = tokenizer.decode(row[prompt_len:prompt_len + limit], skip_special_tokens=True).strip()
+    return texts
+
+# ===== Llama 프롬프트 (기사와 무관한 부분은 미리 생성) =====
+PROMPT_SYSTEM_PREAMBLE = (
+    "You are an expert prompt engineer for image generation models.\n"
+    "Write a single concise English prompt optimized for GPT-Image 1.\n"
+    "Generate one 1024x1024 cartoon-style illustration arranged as a 2x2 four-panel comic.\n"
+    "Panels must be seamlessly connected with absolutely no borders, gutters, or spacing.\n"
+    "Style for all panels: clean simple backgrounds, consistent lighting, crisp details, "
+    "smooth line art, realistic hand anatomy and face, no watermarks.\n"
+    "Each panel must visually depict the meaning of its summary in a concrete, context-aware scene.\n"
+    "No Unrealistic Face or hand, Natural FACE\n"
+    "No text except for simple very clean logos or keywords such as 'HMMMME', 'KIA', 'AI', HYUNDAI\n"
+    "Avoid generic clichés unless explicitly implied.\n"
+    "Exclude all forms of written language or typographic marks.\n"
+    "Maintain cohesive composition across all four panels.\n\n"
+)
+
+# 패널 A~D 요약 슬롯 ({0}~{3})
+PROMPT_PANELS_TEMPLATE = (
+    "Panel A (top-left): Visualize the essence of Summary 1. No text.\n"
+    "Summary 1:\n{0}\n\n"
+    "Panel B (top-right): Visualize the essence of Summary 2. No text.\n"
+    "Summary 2:\n{1}\n\n"
+    "Panel C (bottom-left): Visualize the essence of Summary 3. No text.\n"
+    "Summary 3:\n{2}\n\n"
+    "Panel D (bottom-right): Visualize the essence of Summary 4. No text.\n"
+    "Summary 4:\n{3}\n\n"
+)
+
+QUIZ_SYSTEM = (
+    "You are a precise quiz generator. "
+    "Create ONLY multiple-choice questions with exactly four options (A–D). "
+    "Return STRICT JSON. No extra commentary."
+)
+
+QUIZ_SCHEMA = {
+    "language": "ko",
+    "topic": "string",
+    "questions": [
+        {
+            "type": "mcq",
+            "question": "string (Korean)",
+            "options": ["A","B","C","D"],
+            "answer": "A|B|C|D",
+            "explanation": "1-2 sentences (Korean)"
+        }
+    ]
+}
+QUIZ_SCHEMA_JSON = json.dumps(QUIZ_SCHEMA, ensure_ascii=False, indent=2)
+
+# 퀴즈 요청문 (요약 목록 앞/뒤, 스키마 JSON의 중괄호 때문에 format 대신 이어 붙임)
+QUIZ_USER_HEAD = """[Task]
+Generate EXACTLY ONE multiple-choice quiz question in Korean that REQUIRES synthesizing 
+information across ALL of the following news summaries.
+
+[Summary]
+"""
+QUIZ_USER_TAIL = """
+
+[Hard Requirements]
+- language: ko
+- type: mcq ONLY
+- The single question MUST combine information from at least two different summaries
+- JSON must contain exactly one item in "questions" array
+- Each "options" must contain exactly 4 items (A, B, C, D), single word only
+- "answer" must be one of "A","B","C","D"
+- Correct option must be placed randomly
+- No text outside the JSON
+
+[JSON Schema]
+""" + QUIZ_SCHEMA_JSON
+
 def _safe_json_extract(s: str) -> str:
-    """JSON 블록 추출"""
+    """첫 번째로 닫히는 JSON 객체 블록 추출 (문자열 안의 중괄호는 무시)"""
     start = s.find("{")
-    end = s.rfind("}")
-    if start == -1 or end == -1 or end <= start:
+    if start == -1:
         raise ValueError("JSON block not found in model output.")
-    return s[start:end+1]
+    depth = 0
+    in_str = escaped = False
+    for i in range(start, len(s)):
+        c = s[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start:i+1]
+    raise ValueError("JSON block not found in model output.")
+
+def _json_loads(s: str):
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
 
 def generate_prompt_and_quiz(news_summaries: List[str]) -> Dict:
     """
@@ -70,52 +313,10 @@ def generate_prompt_and_quiz(news_summaries: List[str]) -> Dict:
     """
     assert len(news_summaries) >= 1, "최소 1개 이상의 요약이 필요합니다"
     
-    model, tokenizer = get_llama_model()
-    torch.manual_seed(102)
-    
-    gen_kwargs = dict(
-        do_sample=True,
-        temperature=0.7,
-        top_p=0.9,
-        repetition_penalty=1.05,
-        max_new_tokens=300,
-        pad_token_id=tokenizer.pad_token_id,
-        eos_token_id=tokenizer.eos_token_id,
-    )
-    
-    gen_quiz_kwargs = dict(
-        do_sample=True,
-        temperature=0.7,
-        top_p=0.9,
-        repetition_penalty=1.05,
-        max_new_tokens=350,
-        pad_token_id=tokenizer.pad_token_id,
-        eos_token_id=tokenizer.eos_token_id,
-    )
+    tokenizer = get_llama_tokenizer()
     
     # ===== 프롬프트 생성 =====
-    system_msg_prompt = (
-        "You are an expert prompt engineer for image generation models.\n"
-        "Write a single concise English prompt optimized for GPT-Image 1.\n"
-        "Generate one 1024x1024 cartoon-style illustration arranged as a 2x2 four-panel comic.\n"
-        "Panels must be seamlessly connected with absolutely no borders, gutters, or spacing.\n"
-        "Style for all panels: clean simple backgrounds, consistent lighting, crisp details, "
-        "smooth line art, realistic hand anatomy and face, no watermarks.\n"
-        "Each panel must visually depict the meaning of its summary in a concrete, context-aware scene.\n"
-        "No Unrealistic Face or hand, Natural FACE\n"
-        "No text except for simple very clean logos or keywords such as 'HMMMME', 'KIA', 'AI', HYUNDAI\n"
-        "Avoid generic clichés unless explicitly implied.\n"
-        "Exclude all forms of written language or typographic marks.\n"
-        "Maintain cohesive composition across all four panels.\n\n"
-        f"Panel A (top-left): Visualize the essence of Summary 1. No text.\n"
-        f"Summary 1:\n{news_summaries[0]}\n\n"
-        f"Panel B (top-right): Visualize the essence of Summary 2. No text.\n"
-        f"Summary 2:\n{news_summaries[1] if len(news_summaries) > 1 else news_summaries[0]}\n\n"
-        f"Panel C (bottom-left): Visualize the essence of Summary 3. No text.\n"
-        f"Summary 3:\n{news_summaries[2] if len(news_summaries) > 2 else news_summaries[0]}\n\n"
-        f"Panel D (bottom-right): Visualize the essence of Summary 4. No text.\n"
-        f"Summary 4:\n{news_summaries[3] if len(news_summaries) > 3 else news_summaries[0]}\n\n"
-    )
+    panels = [news_summaries[k] if len(news_summaries) > k else news_summaries[0] for k in range(4)]
     
     user_msg_prompt = (
         f"News summaries:\n{news_summaries}\n\n"
@@ -123,88 +324,31 @@ def generate_prompt_and_quiz(news_summaries: List[str]) -> Dict:
         "No extra fingers; realistic hand anatomy and face.\n"
     )
     
-    messages = [
-        {"role": "system", "content": system_msg_prompt},
-        {"role": "user", "content": user_msg_prompt}
-    ]
-    
-    chat = tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
-    inputs = tokenizer(chat, return_tensors="pt", padding=True).to(model.device)
-    
-    with torch.no_grad():
-        out = model.generate(**inputs, **gen_kwargs)
-    
-    new_tokens = out[0, inputs["input_ids"].shape[-1]:]
-    prompt_text = tokenizer.decode(new_tokens, skip_special_tokens=True).strip()
-    prompt_text = prompt_text.strip().strip('"').strip("'").strip()
-    
-    print(f"✅ 프롬프트 생성 완료: {prompt_text[:100]}...")
+    prompt_chat = _render_chat(tokenizer,
+                               PROMPT_SYSTEM_PREAMBLE + PROMPT_PANELS_TEMPLATE.format(*panels),
+                               user_msg_prompt)
     
     # ===== 퀴즈 생성 =====
     combined_summary = "\n".join([f"{i+1}) {s}" for i, s in enumerate(news_summaries)])
+    quiz_user = QUIZ_USER_HEAD + combined_summary + QUIZ_USER_TAIL
     
-    QUIZ_SYSTEM = (
-        "You are a precise quiz generator. "
-        "Create ONLY multiple-choice questions with exactly four options (A–D). "
-        "Return STRICT JSON. No extra commentary."
-    )
-    
-    QUIZ_SCHEMA = {
-        "language": "ko",
-        "topic": "string",
-        "questions": [
-            {
-                "type": "mcq",
-                "question": "string (Korean)",
-                "options": ["A","B","C","D"],
-                "answer": "A|B|C|D",
-                "explanation": "1-2 sentences (Korean)"
-            }
-        ]
-    }
-    
-    quiz_user = f"""
-[Task]
-Generate EXACTLY ONE multiple-choice quiz question in Korean that REQUIRES synthesizing 
-information across ALL of the following news summaries.
-
-[Summary]
-{combined_summary}
-
-[Hard Requirements]
-- language: ko
-- type: mcq ONLY
-- The single question MUST combine information from at least two different summaries
-- JSON must contain exactly one item in "questions" array
-- Each "options" must contain exactly 4 items (A, B, C, D), single word only
-- "answer" must be one of "A","B","C","D"
-- Correct option must be placed randomly
-- No text outside the JSON
-
-[JSON Schema]
-{json.dumps(QUIZ_SCHEMA, ensure_ascii=False, indent=2)}
-""".strip()
-    
-    quiz_messages = [
-        {"role": "system", "content": QUIZ_SYSTEM},
-        {"role": "user", "content": quiz_user}
-    ]
-    
-    quiz_chat = tokenizer.apply_chat_template(quiz_messages, tokenize=False, add_generation_prompt=True)
-    quiz_inputs = tokenizer(quiz_chat, return_tensors="pt").to(model.device)
+    quiz_chat = _render_chat(tokenizer, QUIZ_SYSTEM, quiz_user)
     
-    with torch.no_grad():
-        quiz_out = model.generate(**quiz_inputs, **gen_quiz_kwargs)
+    # ===== 프롬프트 + 퀴즈를 한 배치로 생성 =====
+    chats = [prompt_chat, quiz_chat]
+    prompt_text, quiz_text_raw = _generate_texts(chats, (300, 350))
+    prompt_text = prompt_text.strip(" \t\r\n\"'")
     
-    quiz_new_tokens = quiz_out[0, quiz_inputs["input_ids"].shape[-1]:]
-    quiz_text_raw = tokenizer.decode(quiz_new_tokens, skip_special_tokens=True).strip()
+    logger.info(f"✅ 프롬프트 생성 완료: {prompt_text[:100]}...")
     
     try:
-        quiz_json = _safe_json_extract(quiz_text_raw)
-        quiz_data = json.loads(quiz_json)
+        quiz_data = _json_loads(_safe_json_extract(quiz_text_raw))
     except Exception:
-        cleaned = quiz_text_raw.strip().strip("`").strip()
-        quiz_data = json.loads(_safe_json_extract(cleaned))
+        # 닫히지 않았거나 JSON이 아닌 블록이면 첫 '{'부터 마지막 '}'까지로 재시도
+        start, end = quiz_text_raw.find("{"), quiz_text_raw.rfind("}")
+        if start == -1 or end <= start:
+            raise ValueError("JSON block not found in model output.")
+        quiz_data = _json_loads(quiz_text_raw[start:end+1])
     
     # 퀴즈 후처리
     def _fix_one(q):
@@ -247,14 +391,16 @@ information across ALL of the following news summaries.
         return q
     
     quiz_data["language"] = "ko"
-    quiz_data["questions"] = [_fix_one(q) for q in quiz_data.get("questions", [])][:1]
-    quiz_data["questions"] = [_rebalance_answer(q) for q in quiz_data.get("questions", [])][:1]
+    # 첫 문항만 사용 (정리 + 정답 위치 조정을 한 번에)
+    questions = list(quiz_data.get("questions", []))[:1]
+    quiz_data["questions"] = [_rebalance_answer(_fix_one(q)) for q in questions]
     
-    print(f"✅ 퀴즈 생성 완료")
+    logger.info(f"✅ 퀴즈 생성 완료")
     
     return {"prompts": prompt_text, "quiz": quiz_data}
 
-def gpt_image_generate(prompt: str, size: str = "1024x1024", quality: str = "standard") -> str:
+def gpt_image_generate(prompt: str, size: str = "1024x1024", quality: str = "standard",
+                       filename: str = "generated_image.png") -> str:
     """
     OpenAI GPT-Image로 이미지 생성
     
@@ -262,13 +408,14 @@ def gpt_image_generate(prompt: str, size: str = "1024x1024", quality: str = "sta
         prompt: 이미지 프롬프트
         size: 이미지 크기
         quality: 품질 (standard or hd)
+        filename: 저장할 파일명 (IMAGES_DIR 기준)
     
     Returns:
         저장된 이미지 파일 경로
     """
-    client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    client = get_openai_client()
     
-    print(f"🎨 이미지 생성 중... (quality: {quality})")
+    logger.info(f"🎨 이미지 생성 중... (quality: {quality})")
     
     result = client.images.generate(
         model="gpt-image-1",
@@ -277,16 +424,51 @@ def gpt_image_generate(prompt: str, size: str = "1024x1024", quality: str = "sta
         quality=quality,
     )
     
-    image_base64 = result.data[0].b64_json
-    image_bytes = base64.b64decode(image_base64)
-    
-    filename = os.path.join(Config.IMAGES_DIR, "generated_image.png")
+    # gpt-image-1은 response_format="url"을 지원하지 않고 항상 b64_json으로만 반환
+    # (URL 다운로드로 base64 디코딩을 건너뛸 수 없으므로 디코딩 결과를 바로 기록)
+    filename = os.path.join(Config.IMAGES_DIR, filename)
     with open(filename, "wb") as f:
-        f.write(image_bytes)
+        f.write(base64.b64decode(result.data[0].b64_json))
     
-    print(f"✅ 이미지 저장: {filename}")
+    logger.info(f"✅ 이미지 저장: {filename}")
     return filename
 
+def generate_image_for_article(art: Dict, art_idx: int = 1) -> Dict:
+    """
+    단일 기사 이미지 + 퀴즈 생성
+    
+    Args:
+        art: summarize_articles() 반환값의 기사 1개
+        art_idx: 기사 번호 (파일명/로그용)
+    
+    Returns:
+        이미지 경로가 추가된 기사
+    """
+    summaries = art.get("summaries", [])
+    if len(summaries) < 1:
+        logger.info(f"  [{art_idx}] SKIP: 요약 없음")
+        art["image_path"] = None
+        art["quiz"] = None
+        return art
+    
+    logger.info(f"  [{art_idx}] {art.get('title', '')[:40]}...")
+    
+    # 프롬프트 + 퀴즈 생성
+    result = generate_prompt_and_quiz(summaries)
+    
+    # 이미지 생성
+    image_path = gpt_image_generate(
+        result["prompts"],
+        size=Config.IMAGE_SIZE,
+        quality=Config.IMAGE_QUALITY,
+        filename=f"image_{art_idx:03d}_{art.get('news_id', 'unknown')}.png"
+    )
+    
+    art["image_path"] = image_path
+    art["quiz"] = result["quiz"]
+    art["prompt"] = result["prompts"]
+    return art
+
 def generate_images(articles: List[Dict]) -> List[Dict]:
     """
     요약된 기사로부터 이미지 생성
@@ -297,31 +479,10 @@ def generate_images(articles: List[Dict]) -> List[Dict]:
     Returns:
         이미지 경로가 추가된 기사 리스트
     """
-    print(f"\n🎨 이미지 생성 시작...")
+    logger.info(f"\n🎨 이미지 생성 시작...")
     
     for i, art in enumerate(articles, 1):
-        summaries = art.get("summaries", [])
-        if len(summaries) < 1:
-            print(f"  [{i}] SKIP: 요약 없음")
-            art["image_path"] = None
-            art["quiz"] = None
-            continue
-        
-        print(f"  [{i}] {art.get('title', '')[:40]}...")
-        
-        # 프롬프트 + 퀴즈 생성
-        result = generate_prompt_and_quiz(summaries)
-        
-        # 이미지 생성
-        image_path = gpt_image_generate(
-            result["prompts"],
-            size=Config.IMAGE_SIZE,
-            quality=Config.IMAGE_QUALITY
-        )
-        
-        art["image_path"] = image_path
-        art["quiz"] = result["quiz"]
-        art["prompt"] = result["prompts"]
+        generate_image_for_article(art, i)
     
-    print(f"✅ 이미지 생성 완료: {len(articles)}개 기사")
+    logger.info(f"✅ 이미지 생성 완료: {len(articles)}개 기사")
     return articles
@@ -2,10 +2,14 @@
 BigKinds API를 통한 뉴스 이슈 수집
 """
 
-import json
-import requests
+import logging
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from config import Config
+from ._http import CONNECT_TIMEOUT, kinds_session
+from ._memo import disk_memoize, content_hash
+
+logger = logging.getLogger(__name__)
 
 
 def kinds_issue_request(date: str, providers: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -25,16 +29,12 @@ def kinds_issue_request(date: str, providers: Optional[List[str]] = None) -> Dic
         "access_key": Config.KINDS_ACCESS_KEY,
         "argument": {
             "date": date,
-            "provider": providers or Config.ISSUE_PROVIDERS_FILTER
+            "provider": providers or sorted(Config.ISSUE_PROVIDERS_FILTER)
         }
     }
     
-    headers = {
-        "Content-Type": "application/json; charset=UTF-8",
-        "Accept": "application/json",
-    }
-    
-    resp = requests.post(API_URL, headers=headers, data=json.dumps(payload))
+    # 기사 크롤링 단계의 KINDS 상세 조회와 같은 keep-alive 세션 사용
+    resp = kinds_session().post(API_URL, json=payload, timeout=(CONNECT_TIMEOUT, 20))
     resp.raise_for_status()
     data = resp.json()
 
@@ -78,10 +78,24 @@ def parse_issue_response(data: Dict[str, Any]) -> Dict[str, Any]:
     return {"date": date, "topics": norm_topics}
 
 
+def _issues_key(date: str, max_topics: int = 10) -> str:
+    # frozenset 순회 순서는 프로세스마다 달라지므로 정렬 후 해시
+    providers = content_hash(sorted(Config.ISSUE_PROVIDERS_FILTER))[:12]
+    return f"{date}_{max_topics}_{providers}"
+
+
+def _is_past_date(date: str, max_topics: int = 10) -> bool:
+    # 오늘 이슈는 하루 동안 바뀌므로 지난 날짜만 캐시
+    return date < datetime.now().strftime("%Y-%m-%d")
+
+
+@disk_memoize(namespace="issues", key=_issues_key, when=_is_past_date)
 def collect_news_issues(date: str, max_topics: int = 10) -> Dict[str, Any]:
     """
     뉴스 이슈 수집 (메인 함수)
     
+    지난 날짜는 (날짜, 토픽 개수, 언론사 필터) 기준으로 outputs/cache/issues/에 캐시
+    
     Args:
         date: 수집할 날짜 (YYYY-MM-DD)
         max_topics: 최대 토픽 개수
@@ -89,7 +103,7 @@ def collect_news_issues(date: str, max_topics: int = 10) -> Dict[str, Any]:
     Returns:
         파싱된 이슈 데이터
     """
-    print(f"📰 {date} 뉴스 이슈 수집 중...")
+    logger.info(f"📰 {date} 뉴스 이슈 수집 중...")
     
     data = kinds_issue_request(date=date)
     issue_obj = parse_issue_response(data)
@@ -97,6 +111,6 @@ def collect_news_issues(date: str, max_topics: int = 10) -> Dict[str, Any]:
     # 상위 N개만 추출
     issue_obj["topics"] = issue_obj["topics"][:max_topics]
     
-    print(f"✅ {len(issue_obj['topics'])}개 이슈 수집 완료")
+    logger.info(f"✅ {len(issue_obj['topics'])}개 이슈 수집 완료")
     
     return issue_obj
@@ -3,60 +3,132 @@
 """
 
 import re
+import logging
+import threading
 import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-from typing import List, Dict
+from transformers.modeling_outputs import BaseModelOutput
+from typing import List, Dict, Tuple
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 # 모델 초기화 (싱글톤)
 _model = None
 _tokenizer = None
+_model_lock = threading.Lock()
+# CUDA 그래프로 인코더를 캡처했는지 (입력 길이/배치 크기를 버킷에 맞춰 패딩해야 재사용됨)
+_graphed = False
+
+# 인코더 입력 길이 / 배치 크기 버킷 (형태마다 CUDA 그래프를 한 번만 캡처)
+# 길이 3 x 배치 2 = 최대 6개 형태로, dynamo 재컴파일 한도(기본 8) 안에 들어감
+INPUT_BUCKETS = (256, 512, 1024)
+BATCH_BUCKETS = tuple(sorted({min(4, Config.SUMMARY_BATCH_SIZE), Config.SUMMARY_BATCH_SIZE}))
 
 def get_model():
-    global _model, _tokenizer
-    if _model is None:
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        print(f"📚 요약 모델 로딩 중... (device: {device})")
-        _tokenizer = AutoTokenizer.from_pretrained(Config.SUMMARY_MODEL)
-        _model = AutoModelForSeq2SeqLM.from_pretrained(Config.SUMMARY_MODEL).to(device).eval()
+    global _model, _tokenizer, _graphed
+    with _model_lock:
+        if _model is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            logger.info(f"📚 요약 모델 로딩 중... (device: {device})")
+            _tokenizer = AutoTokenizer.from_pretrained(Config.SUMMARY_MODEL)
+            # bf16 지원 GPU에서는 가중치를 bf16으로 (디코딩 가중치 대역폭 절반, T5는 fp16에서 overflow 위험)
+            dtype = torch.bfloat16 if device == "cuda" and torch.cuda.is_bf16_supported() else torch.float32
+            _model = AutoModelForSeq2SeqLM.from_pretrained(
+                Config.SUMMARY_MODEL, torch_dtype=dtype
+            ).to(device).eval()
+            if device == "cuda":
+                # 인코더는 버킷 길이 고정 형태라 CUDA 그래프 재생으로 커널 실행 오버헤드 제거
+                # (디코더는 스텝마다 KV 캐시 길이가 달라져 그래프를 재사용할 수 없음)
+                _model.encoder.forward = torch.compile(
+                    _model.encoder.forward, mode="reduce-overhead", dynamic=False
+                )
+                _graphed = True
     return _model, _tokenizer
 
+def _bucket_len(n: int) -> int:
+    """n 이상인 가장 작은 버킷 길이 (마지막 버킷이 상한)"""
+    for b in INPUT_BUCKETS:
+        if n <= b:
+            return b
+    return INPUT_BUCKETS[-1]
+
+def _bucket_rows(n: int) -> int:
+    """n 이상인 가장 작은 배치 버킷 (버킷보다 크면 그대로)"""
+    for b in BATCH_BUCKETS:
+        if n <= b:
+            return b
+    return n
+
+def _encode_bucketed(model, inputs) -> BaseModelOutput:
+    """
+    배치 크기까지 버킷에 맞춰 인코더 실행 (CUDA 그래프 재사용)
+    
+    모자란 행은 첫 행을 복제해 채우고, 결과에서 잘라내므로 디코더는 실제 행만 처리한다.
+    """
+    n = inputs["input_ids"].shape[0]
+    rows = _bucket_rows(n)
+    ids, mask = inputs["input_ids"], inputs["attention_mask"]
+    if rows > n:
+        ids = torch.cat([ids, ids[:1].expand(rows - n, -1)])
+        mask = torch.cat([mask, mask[:1].expand(rows - n, -1)])
+    out = model.encoder(input_ids=ids, attention_mask=mask, return_dict=True)
+    # 그래프 출력 버퍼는 다음 재생 때 덮어쓰이므로 복사
+    return BaseModelOutput(last_hidden_state=out.last_hidden_state[:n].clone())
+
+# clean: [..] / (..) / 저작권 문구를 한 번의 탐색으로 제거
+CLEAN_RE = re.compile(r"\[[^\]]+\]|\([^)]+\)|무단 전재.*?금지")
+# postprocess: 기자명 / 통신사명
+POST_RE = re.compile(r"[가-힣]{2,4}\s?기자|연합뉴스")
+WS_RE = re.compile(r"\s+")
+SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# 프롬프트에서 지울 따옴표 (곧은/둥근 큰따옴표, 작은따옴표)
+PROMPT_QUOTES_TBL = str.maketrans("", "", "\"'\u201c\u201d\u2018\u2019")
+
 def clean(x): 
-    x = re.sub(r"\[[^\]]+\]", " ", x)
-    x = re.sub(r"\([^)]+\)", " ", x)
-    x = re.sub(r"무단 전재.*?금지", " ", x)
-    x = re.sub(r"\s+", " ", x)
+    x = CLEAN_RE.sub(" ", x)
+    x = WS_RE.sub(" ", x)
     return x.strip()
 
 def postprocess(summary: str) -> str:
-    summary = re.sub(r"[가-힣]{2,4}\s?기자", "", summary)
-    summary = re.sub(r"연합뉴스", "", summary)
-    summary = re.sub(r"\s+", " ", summary)
+    summary = POST_RE.sub("", summary)
+    summary = WS_RE.sub(" ", summary)
     return summary.strip()
 
 @torch.inference_mode()
-def summarize(text, max_in=1024, max_out=100, min_out=50,
-              beams=5, lp=0.8, no_rep=3, rep_penalty=2.0):
+def summarize(texts: List[str], max_in=1024, max_out=100, min_out=50,
+              beams=None, lp=0.8, no_rep=3, rep_penalty=2.0) -> List[str]:
+    """여러 텍스트를 한 배치로 요약 (generate 1회, 입력 순서대로 반환)"""
     model, tokenizer = get_model()
     device = next(model.parameters()).device
     
-    text = clean(text)
-    inputs = tokenizer([text], truncation=True, max_length=max_in, return_tensors="pt").to(device)
+    texts = [clean(t) for t in texts]
+    # 패딩 위치는 attention_mask로 가려지므로 행별 요약 결과는 따로 생성할 때와 같음
+    enc = tokenizer(texts, truncation=True, max_length=max_in)
+    if _graphed:
+        size = _bucket_len(max(len(ids) for ids in enc["input_ids"]))
+        inputs = tokenizer.pad(enc, padding="max_length", max_length=size, return_tensors="pt").to(device)
+        inputs = {"encoder_outputs": _encode_bucketed(model, inputs),
+                  "attention_mask": inputs["attention_mask"]}
+    else:
+        inputs = tokenizer.pad(enc, padding=True, return_tensors="pt").to(device)
+    # 기본은 greedy 디코딩 (빔 5개 대비 디코더 계산량 1/5, length_penalty 등은 빔 탐색에서만 사용)
+    beams = Config.SUMMARY_NUM_BEAMS if beams is None else beams
+    beam_kwargs = dict(num_beams=beams, length_penalty=lp, early_stopping=True) if beams > 1 else {}
     ids = model.generate(
         **inputs,
-        num_beams=beams,
+        do_sample=False,
         max_length=max_out, 
         min_length=min_out,
-        length_penalty=lp,
         no_repeat_ngram_size=no_rep,
         repetition_penalty=rep_penalty,
-        early_stopping=True
+        **beam_kwargs
     )
-    return tokenizer.decode(ids[0], skip_special_tokens=True)
+    return tokenizer.batch_decode(ids, skip_special_tokens=True)
 
 def chunk_text(text, n=4):
     """텍스트를 n개로 균등 분할"""
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = SENT_SPLIT_RE.split(text)
     k, m = divmod(len(sentences), n)
     chunks, start = [], 0
     for i in range(n):
@@ -65,47 +137,60 @@ def chunk_text(text, n=4):
         start = end
     return chunks
 
-def summarize_dynamic(text):
-    """텍스트 길이에 따라 동적으로 요약"""
+def _length_budget(length: int) -> Tuple[int, int]:
+    """입력 토큰 수에 따른 (min_out, max_out)"""
+    if length < 100:
+        return 10, 80
+    if length < 300:
+        return 30, 100
+    return 50, 120
+
+def summarize_dynamic(texts: List[str]) -> List[str]:
+    """텍스트 길이에 따라 동적으로 요약 (요약 길이 구간이 같은 텍스트끼리 한 배치로 생성)"""
     tokenizer = get_model()[1]
-    length = len(tokenizer.tokenize(text))
+    # 길이만 필요하므로 토큰 문자열 없이 id만, 모든 텍스트를 한 번의 배치 호출로 계산
+    lengths = [len(ids) for ids in tokenizer(texts, add_special_tokens=False)["input_ids"]]
+    groups: Dict[Tuple[int, int], List[int]] = {}
+    for i, length in enumerate(lengths):
+        groups.setdefault(_length_budget(length), []).append(i)
     
-    if length < 100:
-        min_out, max_out = 10, 80
-    elif length < 300:
-        min_out, max_out = 30, 100
-    else:
-        min_out, max_out = 50, 120
-        
-    return summarize(text, min_out=min_out, max_out=max_out)
+    out = [""] * len(texts)
+    size = Config.SUMMARY_BATCH_SIZE
+    for (min_out, max_out), idxs in groups.items():
+        # 여러 기사를 한 번에 넘겨도 배치 크기(GPU 메모리)는 SUMMARY_BATCH_SIZE 이하
+        for k in range(0, len(idxs), size):
+            part = idxs[k:k + size]
+            batch = summarize([texts[i] for i in part], min_out=min_out, max_out=max_out)
+            for i, summary in zip(part, batch):
+                out[i] = summary
+    return out
 
 def clean_for_prompt(text: str) -> str:
     """이미지 프롬프트용 안전 문자열"""
-    remove_chars = ['"', "'", """, """, "'", "'"]
-    for ch in remove_chars:
-        text = text.replace(ch, "")
-    return text.strip()
+    return text.translate(PROMPT_QUOTES_TBL).strip()
 
-def summarize_in_parts(text, parts=4):
-    """텍스트를 파트별로 나눠 요약"""
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+def _part_chunks(text: str, parts: int) -> List[Tuple[int, str]]:
+    """(파트 번호, 본문 조각) 리스트 (빈 조각 제외)"""
+    sentences = SENT_SPLIT_RE.split(text)
     
     # 파트 개수 자동 조정
     if len(sentences) < parts:
         parts = max(1, len(sentences))
     
-    chunks = chunk_text(text, n=parts)
-    summaries = []
-    
-    for i, chunk in enumerate(chunks, 1):
-        if not chunk.strip():
-            continue
-        summary = summarize_dynamic(chunk)
-        summary = clean_for_prompt(summary)
-        summary = postprocess(summary)
-        summaries.append(f"파트 {i}: {summary}")
-    
-    return summaries
+    return [(i, chunk) for i, chunk in enumerate(chunk_text(text, n=parts), 1) if chunk.strip()]
+
+def _format_parts(part_nos: List[int], summaries: List[str]) -> List[str]:
+    """요약 후처리 + '파트 N:' 접두어"""
+    return [f"파트 {i}: {postprocess(clean_for_prompt(summary))}"
+            for i, summary in zip(part_nos, summaries)]
+
+def summarize_in_parts(text, parts=4):
+    """텍스트를 파트별로 나눠 요약"""
+    chunks = _part_chunks(text, parts)
+    if not chunks:
+        return []
+    part_nos, texts = zip(*chunks)
+    return _format_parts(part_nos, summarize_dynamic(list(texts)))
 
 def summarize_articles(articles: List[Dict]) -> List[Dict]:
     """
@@ -117,21 +202,26 @@ def summarize_articles(articles: List[Dict]) -> List[Dict]:
     Returns:
         요약이 추가된 기사 리스트
     """
-    print(f"\n✍️ 기사 요약 시작...")
+    logger.info(f"\n✍️ 기사 요약 시작...")
+    
+    # 모든 기사의 본문 조각을 열 단위(조각 / 파트 번호 / 기사 위치)로 모아 한 번에 요약
+    texts: List[str] = []
+    part_nos: List[int] = []
+    owners: List[int] = []
+    for k, art in enumerate(articles):
+        for i, chunk in _part_chunks(art.get("content", ""), Config.SUMMARY_PARTS):
+            texts.append(chunk)
+            part_nos.append(i)
+            owners.append(k)
+    
+    formatted = _format_parts(part_nos, summarize_dynamic(texts)) if texts else []
+    for art in articles:
+        art["summaries"] = []
+    for k, summary in zip(owners, formatted):
+        articles[k]["summaries"].append(summary)
     
     for i, art in enumerate(articles, 1):
-        content = art.get("content", "")
-        if not content.strip():
-            print(f"  [{i}] SKIP: 본문 없음")
-            art["summaries"] = []
-            continue
-        
-        print(f"  [{i}] {art.get('title', '')[:40]}...")
-        summaries = summarize_in_parts(content, parts=Config.SUMMARY_PARTS)
-        art["summaries"] = summaries
-        
-        for s in summaries:
-            print(f"    - {s}")
+        logger.info(f"  [{i}] {art.get('title', '')[:40]}... ({len(art['summaries'])}개 파트)")
     
-    print(f"✅ 요약 완료: {len(articles)}개 기사")
+    logger.info(f"✅ 요약 완료: {len(articles)}개 기사")
     return articles
@@ -3,25 +3,42 @@ Google Cloud TTS를 이용한 음성 생성
 """
 
 import os
+import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from google.cloud import texttospeech
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from config import Config
 
+logger = logging.getLogger(__name__)
+
 # TTS 클라이언트 초기화 (싱글톤)
 _tts_client = None
+_tts_client_lock = threading.Lock()
 
 def get_tts_client():
     global _tts_client
-    if _tts_client is None:
-        # 환경 변수 설정 확인
-        if not os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = Config.GOOGLE_APPLICATION_CREDENTIALS
-        
-        print(f"🔊 TTS 클라이언트 초기화 중...")
-        _tts_client = texttospeech.TextToSpeechClient()
+    with _tts_client_lock:
+        if _tts_client is None:
+            # 환경 변수 설정 확인
+            if not os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
+                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = Config.GOOGLE_APPLICATION_CREDENTIALS
+            
+            logger.info(f"🔊 TTS 클라이언트 초기화 중...")
+            _tts_client = texttospeech.TextToSpeechClient()
     return _tts_client
 
+# 합성 요청 스레드 풀 (싱글톤, 동기 gRPC 클라이언트는 스레드 간 공유 가능)
+_tts_pool = None
+
+def get_tts_pool() -> ThreadPoolExecutor:
+    global _tts_pool
+    with _tts_client_lock:
+        if _tts_pool is None:
+            _tts_pool = ThreadPoolExecutor(max_workers=Config.TTS_WORKERS, thread_name_prefix="tts")
+    return _tts_pool
+
 PART_PREFIX = re.compile(r"^\s*파트\s*\d+\s*:\s*")
 
 def strip_part_prefix(text: str) -> str:
@@ -68,6 +85,51 @@ def generate_tts_for_text(text: str, output_path: str) -> str:
     
     return output_path
 
+def generate_tts_for_article(art: Dict, art_idx: int = 1) -> Dict:
+    """
+    단일 기사의 요약문을 TTS로 변환
+    
+    Args:
+        art: summarize_articles() 반환값의 기사 1개
+        art_idx: 기사 번호 (파일명/로그용)
+    
+    Returns:
+        TTS 파일 경로가 추가된 기사
+    """
+    summaries = art.get("summaries", [])
+    if not summaries:
+        logger.info(f"  [{art_idx}] SKIP: 요약 없음")
+        art["tts_files"] = []
+        return art
+    
+    logger.info(f"  [{art_idx}] {art.get('title', '')[:40]}...")
+    
+    jobs = _part_jobs(art_idx, summaries)
+    art["tts_files"] = _synthesize_all(jobs)
+    for _, filepath in jobs:
+        logger.info(f"    - 저장: {os.path.basename(filepath)}")
+    return art
+
+def _part_jobs(art_idx: int, summaries: List[str]) -> List[Tuple[str, str]]:
+    """기사 요약문별 (텍스트, 저장 경로)"""
+    return [
+        (summary, os.path.join(Config.TTS_DIR, f"{art_idx:03d}_{part_idx:02d}.mp3"))
+        for part_idx, summary in enumerate(summaries, 1)
+    ]
+
+def _synthesize_all(jobs: List[Tuple[str, str]]) -> List[str]:
+    """
+    (텍스트, 저장 경로) 목록을 동시에 합성
+    
+    합성 시간은 대부분 네트워크 왕복이므로 요청을 스레드 풀에서 동시에 보낸다.
+    
+    Returns:
+        저장 경로 리스트 (jobs 순서)
+    """
+    pool = get_tts_pool()
+    futures = [pool.submit(generate_tts_for_text, text, path) for text, path in jobs]
+    return [fut.result() for fut in futures]
+
 def generate_tts(articles: List[Dict]) -> List[Dict]:
     """
     요약문을 TTS로 변환
@@ -78,27 +140,14 @@ def generate_tts(articles: List[Dict]) -> List[Dict]:
     Returns:
         TTS 파일 경로가 추가된 기사 리스트
     """
-    print(f"\n🔊 TTS 생성 시작...")
-    
-    for art_idx, art in enumerate(articles, 1):
-        summaries = art.get("summaries", [])
-        if not summaries:
-            print(f"  [{art_idx}] SKIP: 요약 없음")
-            art["tts_files"] = []
-            continue
-        
-        print(f"  [{art_idx}] {art.get('title', '')[:40]}...")
-        
-        tts_files = []
-        for part_idx, summary in enumerate(summaries, 1):
-            filename = f"{art_idx:03d}_{part_idx:02d}.mp3"
-            filepath = os.path.join(Config.TTS_DIR, filename)
-            
-            generate_tts_for_text(summary, filepath)
-            tts_files.append(filepath)
-            print(f"    - 저장: {filename}")
-        
-        art["tts_files"] = tts_files
+    logger.info(f"\n🔊 TTS 생성 시작...")
+    
+    # 모든 기사의 요약문을 한 번에 예약 (기사 단위로 기다리지 않음)
+    per_article = [_part_jobs(art_idx, art.get("summaries", []))
+                   for art_idx, art in enumerate(articles, 1)]
+    files = iter(_synthesize_all([job for jobs in per_article for job in jobs]))
+    for art, jobs in zip(articles, per_article):
+        art["tts_files"] = [next(files) for _ in jobs]
     
-    print(f"✅ TTS 생성 완료: {len(articles)}개 기사")
+    logger.info(f"✅ TTS 생성 완료: {len(articles)}개 기사")
     return articles
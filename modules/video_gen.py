@@ -1,21 +1,81 @@
 """
-MoviePy를 이용한 숏츠 영상 생성
+숏츠 영상 생성 (Pillow로 파트별 화면 합성, ffmpeg로 인코딩)
 """
 
 import os
+import logging
+import math
 import re
-import textwrap
+import subprocess
+import tempfile
+from functools import lru_cache
 import numpy as np
-from moviepy.editor import *
+from moviepy.config import get_setting
 from PIL import Image, ImageDraw, ImageFont
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from config import Config
 
+try:
+    import cv2
+except ImportError:  # OpenCV 미설치 시 Pillow로 리사이즈
+    cv2 = None
+
+logger = logging.getLogger(__name__)
+
+# 글자 조합(shaping)이 필요 없는 문자만으로 된 텍스트 (라틴/키릴 등, 구두점/기호,
+# 한글 완성형/호환 자모, 한자, 가나, 전각 문자). 결합 문자(발음 구별 부호 U+0300-036F,
+# 키릴 결합 부호 U+0483-0489, 기호용 결합 부호 U+20D0-20FF, 가나 탁점 U+3099-309A,
+# 한글 방점 U+302A-302F)와 ZWNJ/ZWJ, 방향 제어 문자는 위치 조정이 필요하므로 제외
+SIMPLE_LAYOUT_RE = re.compile(
+    "[\x00-\u02FF\u0370-\u0482\u048A-\u058F"
+    "\u2000-\u200B\u2010-\u2029\u202F-\u2065\u2070-\u20CF\u2100-\u2BFF"
+    "\u3000-\u3029\u3030-\u3098\u309B-\u30FF\u3130-\u318F"
+    "\u4E00-\u9FFF\uAC00-\uD7AF\uFF00-\uFFEF]*"
+)
+
+# 자막 줄바꿈 단위: 한중일 글자 하나 / 공백 덩어리 / 영숫자·기호 덩어리
+# (세 분류는 서로 겹치지 않으므로 한글 자막에서 가장 흔한 글자 분류를 먼저 검사).
+# 뒤따르는 결합 문자(SIMPLE_LAYOUT_RE에서 제외한 것들)와 ZWNJ/ZWJ는 앞 글자 토큰에 붙여
+# 줄 머리로 떨어지거나 빠지지 않게 한다
+CAPTION_MARKS = r"[\u0300-\u036F\u0483-\u0489\u200C\u200D\u20D0-\u20FF\u302A-\u302F\u3099\u309A]*"
+CAPTION_TOKEN_RE = re.compile(
+    r"([\u4E00-\u9FFF\u3040-\u3098\u309B-\u30FF\uAC00-\uD7AF]" + CAPTION_MARKS + r"|\s+"
+    r"|[A-Za-z0-9_.,;:/\\\-+*=?@#%^&(){}<>\[\]'\"`~]+" + CAPTION_MARKS + ")"
+)
+
+@lru_cache(maxsize=128)
+def get_font(font_path: str, size: int, basic: bool = False):
+    """
+    TTF 파싱 결과 캐시 (자동 맞춤 반복/파트/기사마다 다시 읽지 않도록)
+    
+    자동 맞춤은 상단 68→18, 하단 32→18 크기를 2씩 줄여 가며 시도하므로 두 폰트의
+    후보 크기(34개)가 모두 캐시에 남도록 여유 있게 잡는다.
+    
+    basic=True면 Raqm 대신 Pillow 기본 레이아웃 엔진을 쓴다 (측정/그리기가 빠르지만
+    아랍/인도계 문자나 조합형 자모처럼 shaping이 필요한 텍스트에는 쓰면 안 됨).
+    """
+    if basic:
+        return ImageFont.truetype(font_path, size, layout_engine=ImageFont.Layout.BASIC)
+    return ImageFont.truetype(font_path, size)
+
 def contain_resize_size(w, h, box_w, box_h):
     """비율 유지하며 박스 안에 맞추기"""
     s = min(box_w / w, box_h / h)
     return int(w * s), int(h * s)
 
+def resize_image(arr: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """
+    RGB 배열 리사이즈 (size: (w, h))
+    
+    OpenCV가 있으면 축소는 INTER_AREA, 확대는 INTER_CUBIC으로 처리하고,
+    없으면 Pillow LANCZOS를 쓴다.
+    """
+    w, h = size
+    if cv2 is not None:
+        shrink = w < arr.shape[1] and h < arr.shape[0]
+        return cv2.resize(arr, (w, h), interpolation=cv2.INTER_AREA if shrink else cv2.INTER_CUBIC)
+    return np.asarray(Image.fromarray(arr).resize((w, h), Image.LANCZOS))
+
 def split_image_2x2(image_path: str) -> List[np.ndarray]:
     """
     이미지를 2x2 (4컷)로 분할
@@ -23,17 +83,73 @@ def split_image_2x2(image_path: str) -> List[np.ndarray]:
     Returns:
         [좌상, 우상, 좌하, 우하] numpy 배열
     """
-    im = Image.open(image_path).convert("RGB")
-    W, H = im.size
+    with Image.open(image_path) as im:
+        arr = np.asarray(im.convert("RGB"))
+    H, W = arr.shape[:2]
     w = W // 2
     h = H // 2
     
-    tl = im.crop((0, 0, w, h))
-    tr = im.crop((w, 0, W, h))
-    bl = im.crop((0, h, w, H))
-    br = im.crop((w, h, W, H))
+    # 한 번 디코딩한 배열을 잘라 쓰되, 타일마다 연속 메모리 사본을 만든다 (리사이즈 입력용)
+    return [
+        arr[:h, :w].copy(), arr[:h, w:].copy(),
+        arr[h:, :w].copy(), arr[h:, w:].copy(),
+    ]
+
+def premultiply_alpha(rgba: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """RGBA 배열 → (알파를 미리 곱한 RGB, 알파) uint8 쌍 (정지 레이어는 한 번만 변환)"""
+    a = rgba[..., 3:4].astype(np.uint16)
+    rgb = ((rgba[..., :3] * a + 127) // 255).astype(np.uint8)
+    return rgb, rgba[..., 3].copy()
+
+def flatten_layers(
+    base: np.ndarray,
+    layers: List[Tuple[np.ndarray, Optional[np.ndarray], Tuple[int, int]]],
+) -> np.ndarray:
+    """
+    정지 레이어들을 한 장의 RGB 프레임으로 합성
+    
+    Args:
+        base: 배경 (H, W, 3) uint8 (제자리에서 덮어씀)
+        layers: [(RGB, 알파, (x, y)), ...] 아래→위 순서. 알파가 None이면 그대로
+                덮고, 있으면 RGB가 premultiply_alpha()로 알파를 곱해 둔 값이라고
+                보고 블렌딩 (화면 밖으로 나간 부분은 잘라냄)
+    """
+    H, W = base.shape[:2]
+    for rgb, alpha, (x, y) in layers:
+        h, w = rgb.shape[:2]
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(W, x + w), min(H, y + h)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        src = rgb[y0 - y:y1 - y, x0 - x:x1 - x]
+        dst = base[y0:y1, x0:x1]
+        if alpha is None:
+            dst[...] = src
+            continue
+        inv = 255 - alpha[y0 - y:y1 - y, x0 - x:x1 - x, None].astype(np.uint16)
+        dst[...] = src + ((dst * inv + 127) // 255).astype(np.uint8)
+    return base
+
+def _split_spans(csum: np.ndarray, inner_w: int):
+    """
+    긴 토큰을 줄 폭 안에 드는 (시작, 끝) 글자 구간들로 나눔
     
-    return [np.array(tl), np.array(tr), np.array(bl), np.array(br)]
+    csum은 글자 폭 누적합(int64). 줄마다 inner_w 안에 드는 가장 긴 구간을 이분
+    탐색하며, 한 글자가 줄보다 넓으면 그 글자만 한 구간으로 둔다.
+    """
+    n = csum.shape[0]
+    spans = []
+    i = 0
+    while i < n:
+        base = csum[i - 1] if i > 0 else 0
+        if csum[i] - base > inner_w:
+            spans.append((i, i + 1))
+            i += 1
+            continue
+        j = int(np.searchsorted(csum, base + inner_w, side="right"))
+        spans.append((i, j))
+        i = j
+    return spans
 
 def render_caption_exact(
     text: str, box_w: int, box_h: int, font_path: str, fs: int,
@@ -41,26 +157,32 @@ def render_caption_exact(
     STROKE_RATIO: float = 0.06, BG_ALPHA: int = 0,
     align: str = "left", ellipsis: bool = True,
     margin_px: int = 0, return_meta: bool = False,
+    measure_only: bool = False,
 ):
-    """자막 렌더링 (실측 줄바꿈)"""
+    """
+    자막 렌더링 (실측 줄바꿈)
+    
+    measure_only=True면 줄바꿈/높이 계산까지만 하고 그리지 않는다
+    (이미지 자리에 None을 돌려주며, 자동 맞춤의 크기 탐색용).
+    """
     box_w = max(40, int(box_w))
     box_h = max(40, int(box_h))
     inner_w = max(10, box_w - 2*PAD_X) - margin_px
     inner_h = max(10, box_h - 2*PAD_Y)
 
-    font = ImageFont.truetype(font_path, fs)
+    font = get_font(font_path, fs, basic=SIMPLE_LAYOUT_RE.fullmatch(text or "") is not None)
     stroke = max(1, int(fs * STROKE_RATIO))
     line_gap = int(fs * 0.30)
 
-    _dummy = Image.new("RGBA", (10, 10))
-    _draw = ImageDraw.Draw(_dummy)
+    # 같은 글자/토큰의 폭은 한 번만 측정 (한글 자막은 글자 단위 측정이 대부분)
+    # 폭 = 글자 진행 폭(getlength) + 좌우 외곽선
+    widths: Dict[str, int] = {}
     
     def width_px(s: str) -> int:
-        b = _draw.textbbox((0,0), s if s else " ", font=font, stroke_width=stroke)
-        return b[2] - b[0]
-
-    CJK = r"[\u4E00-\u9FFF\u3040-\u30FF\uAC00-\uD7AF]"
-    token_re = re.compile(rf"(\s+|[A-Za-z0-9_.,;:/\\\-+*=?@#%^&(){{}}<>\[\]'\"`~]+|{CJK})")
+        w = widths.get(s)
+        if w is None:
+            w = widths[s] = math.ceil(font.getlength(s if s else " ")) + 2*stroke
+        return w
 
     lines, cur, cur_w = [], "", 0
     for para in (text or "").replace("\r","").split("\n"):
@@ -71,26 +193,22 @@ def render_caption_exact(
             lines.append("")
             continue
         
-        for tok in token_re.findall(para):
+        for tok in CAPTION_TOKEN_RE.findall(para):
             if width_px(tok) > inner_w:
                 if cur:
                     lines.append(cur)
                     cur, cur_w = "", 0
-                for ch in tok:
-                    wch = width_px(ch)
-                    if cur == "":
-                        if wch <= inner_w:
-                            cur, cur_w = ch, wch
-                        else:
-                            lines.append(ch)
-                            cur, cur_w = "", 0
-                    else:
-                        if cur_w + wch <= inner_w:
-                            cur += ch
-                            cur_w += wch
-                        else:
-                            lines.append(cur)
-                            cur, cur_w = ch, wch
+                csum = np.cumsum(np.array([width_px(ch) for ch in tok], dtype=np.int64))
+                spans = _split_spans(csum, int(inner_w))
+                for a, b in spans[:-1]:
+                    lines.append(tok[a:b])
+                # 마지막 구간은 줄에 들어가면 다음 토큰과 이어 붙일 수 있도록 현재 줄로 둠
+                a, b = spans[-1]
+                last_w = int(csum[b-1]) - (int(csum[a-1]) if a else 0)
+                if last_w > inner_w:
+                    lines.append(tok[a:b])
+                else:
+                    cur, cur_w = tok[a:b], last_w
                 continue
             
             if cur == "":
@@ -106,10 +224,12 @@ def render_caption_exact(
     if cur != "" or (not lines):
         lines.append(cur)
 
+    # 줄 높이는 글꼴 메트릭(ascent+descent)과 외곽선 두께로 고정 (줄마다 측정하지 않음)
+    ascent, descent = font.getmetrics()
+    line_height = ascent + descent + 2*stroke
+    
     fitted, h, overflowed = [], 0, False
     for ln in lines:
-        bb = _draw.textbbox((0,0), ln if ln else " ", font=font, stroke_width=stroke)
-        line_height = bb[3] - bb[1]
         next_h = h + line_height + (line_gap if fitted else 0)
         if next_h <= inner_h:
             fitted.append(ln)
@@ -119,65 +239,68 @@ def render_caption_exact(
             if ellipsis and fitted:
                 last = fitted[-1]
                 ell = "…"
-                def fits(txt):
-                    b = _draw.textbbox((0,0), txt if txt else " ", font=font, stroke_width=stroke)
-                    return (b[2]-b[0]) <= inner_w
                 cand = last
-                while cand and not fits(cand + ell):
+                while cand and width_px(cand + ell) > inner_w:
                     cand = cand[:-1]
                 fitted[-1] = (cand + ell) if cand else ell
             break
 
-    tot_h, line_sizes = 0, []
-    for ln in (fitted or [" "]):
-        b = _draw.textbbox((0,0), ln if ln else " ", font=font, stroke_width=stroke)
-        lw, lh = b[2]-b[0], b[3]-b[1]
-        line_sizes.append((lw, lh))
-        tot_h += lh + line_gap
-    if fitted:
-        tot_h -= line_gap
+    if measure_only:
+        meta = {"overflow": overflowed, "cap_w": box_w,
+                "cap_h": min(box_h, max(1, h + 2*PAD_Y))}
+        return (None, meta) if return_meta else None
+
+    rows = fitted or [" "]
+    tot_h = len(rows) * (line_height + line_gap) - (line_gap if fitted else 0)
 
     cap_w = box_w
     cap_h = min(box_h, max(1, tot_h + 2*PAD_Y))
-    img = Image.new("RGBA", (cap_w, cap_h), (0,0,0,0))
-    
-    if BG_ALPHA > 0:
-        img.alpha_composite(Image.new("RGBA", (cap_w, cap_h), (0,0,0,BG_ALPHA)), (0,0))
+    img = Image.new("RGBA", (cap_w, cap_h), (0,0,0,max(0, BG_ALPHA)))
     
     draw = ImageDraw.Draw(img)
 
     y = PAD_Y
-    for (ln, (lw, lh)) in zip(fitted or [" "], line_sizes):
-        x = max(PAD_X, (cap_w - lw)//2) if align=="center" else PAD_X
+    for ln in rows:
+        x = max(PAD_X, (cap_w - width_px(ln))//2) if align=="center" else PAD_X
         draw.text((x, y), ln if ln else " ", font=font,
                   fill=(255,255,255,255), stroke_width=stroke, stroke_fill=(0,0,0,255))
-        y += lh + line_gap
+        y += line_height + line_gap
 
     if return_meta:
         return np.array(img), {"overflow": overflowed, "cap_w": cap_w, "cap_h": cap_h}
     return np.array(img)
 
 def render_caption_autofit(text, box_w, box_h, font_path, fs_start, fs_min=28, **kwargs):
-    """폰트 사이즈를 줄여가며 자동 맞춤"""
+    """
+    폰트 사이즈를 줄여가며 자동 맞춤
+    
+    fs_start부터 2씩 줄인 후보 중 넘치지 않는 가장 큰 크기를 이분 탐색으로 찾는다
+    (크기가 작을수록 넘치지 않으므로 순서대로 시도한 결과와 같다).
+    """
     ABS_MIN = 18
     cur_min = min(fs_min, ABS_MIN)
-    fs = fs_start
+    sizes = list(range(fs_start, cur_min - 1, -2))
     
-    while fs >= cur_min:
-        img_np, meta = render_caption_exact(
-            text, box_w, box_h, font_path, fs=fs,
-            ellipsis=False, return_meta=True, **kwargs
+    # 탐색 중에는 넘침 여부만 측정하고, 고른 크기로 한 번만 그린다
+    fs = cur_min
+    lo, hi = 0, len(sizes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        _, meta = render_caption_exact(
+            text, box_w, box_h, font_path, fs=sizes[mid],
+            ellipsis=False, return_meta=True, measure_only=True, **kwargs
         )
-        if not meta["overflow"]:
-            meta["used_fs"] = fs
-            return img_np, meta
-        fs -= 2
+        if meta["overflow"]:
+            lo = mid + 1
+        else:
+            fs = sizes[mid]
+            hi = mid
     
     img_np, meta = render_caption_exact(
-        text, box_w, box_h, font_path, fs=cur_min,
+        text, box_w, box_h, font_path, fs=fs,
         ellipsis=False, return_meta=True, **kwargs
     )
-    meta["used_fs"] = cur_min
+    meta["used_fs"] = fs
     return img_np, meta
 
 def generate_video_from_parts(
@@ -220,12 +343,23 @@ def generate_video_from_parts(
     TOP_H = int(H * TOP_H_RATIO)
     BOT_H = int(H * BOT_H_RATIO)
     
-    # 파트별 처리
-    shots = []
-    for img_tile, text_part, audio_path in zip(image_tiles, text_parts, audio_paths):
-        audio = AudioFileClip(audio_path)
-        dur = audio.duration
-        
+    # 상단 자막은 파트 공통이므로 한 번만 렌더링
+    top_np = None
+    top_h_used = 0
+    if top_text:
+        top_np, top_meta = render_caption_autofit(
+            top_text, CAP_W, TOP_H, Config.FONT_TOP_PATH,
+            fs_start=FIXED_FS_TOP, fs_min=40,
+            align="center", PAD_X=PAD_X, PAD_Y=PAD_Y,
+            STROKE_RATIO=STROKE_RATIO, BG_ALPHA=BG_ALPHA
+        )
+        top_h_used = int(top_meta["cap_h"])
+        top_layer = premultiply_alpha(top_np)
+    
+    # 파트별 처리: 파트마다 화면이 고정이므로 한 장의 정지 프레임으로 합성
+    frames = []
+    durations = probe_durations(audio_paths)
+    for img_tile, text_part in zip(image_tiles, text_parts):
         # 하단 자막
         bot_np, bot_meta = render_caption_autofit(
             text_part, CAP_W, BOT_H, Config.FONT_PATH,
@@ -233,56 +367,162 @@ def generate_video_from_parts(
             align="left", PAD_X=PAD_X, PAD_Y=PAD_Y,
             STROKE_RATIO=STROKE_RATIO, BG_ALPHA=BG_ALPHA
         )
-        bot_clip = ImageClip(bot_np).set_duration(dur)
         bot_h_used = int(bot_meta["cap_h"])
         
-        # 상단 자막
-        top_clip = None
-        top_h_used = 0
-        if top_text:
-            top_np, top_meta = render_caption_autofit(
-                top_text, CAP_W, TOP_H, Config.FONT_TOP_PATH,
-                fs_start=FIXED_FS_TOP, fs_min=40,
-                align="center", PAD_X=PAD_X, PAD_Y=PAD_Y,
-                STROKE_RATIO=STROKE_RATIO, BG_ALPHA=BG_ALPHA
-            )
-            top_clip = ImageClip(top_np).set_duration(dur)
-            top_h_used = int(top_meta["cap_h"])
-        
         # 이미지 배치 공간
         free_top_y = TOP_Y + top_h_used
         free_bot_y = H - (bot_h_used + BOTTOM_Y)
         free_h = max(50, free_bot_y - free_top_y)
         
-        base = ColorClip(size=(W, H), color=(0, 0, 0)).set_duration(dur)
-        
         # 이미지 리사이즈 & 배치
-        raw = ImageClip(img_tile)
-        new_w, new_h = contain_resize_size(raw.w, raw.h, W, free_h)
+        new_w, new_h = contain_resize_size(img_tile.shape[1], img_tile.shape[0], W, free_h)
         img_y = int(free_top_y + (free_h - new_h) // 2)
-        img = raw.resize(newsize=(new_w, new_h)).set_duration(dur)
         
-        layers = [base, img.set_position(("center", img_y))]
+        layers = [(resize_image(img_tile, (new_w, new_h)), None, ((W - new_w) // 2, img_y))]
         
-        if top_clip is not None:
-            layers.append(top_clip.set_position(((W - top_clip.w)//2, int(TOP_Y))))
+        if top_np is not None:
+            layers.append((*top_layer, ((W - top_np.shape[1])//2, int(TOP_Y))))
         
-        bottom_y = H - bot_clip.h - BOTTOM_Y
-        layers.append(bot_clip.set_position(((W - bot_clip.w)//2, int(bottom_y))))
+        bottom_y = H - bot_np.shape[0] - BOTTOM_Y
+        layers.append((*premultiply_alpha(bot_np), ((W - bot_np.shape[1])//2, int(bottom_y))))
         
-        shot = CompositeVideoClip(layers, size=(W, H)).set_duration(dur).set_audio(audio)
-        shots.append(shot)
+        frames.append(flatten_layers(np.zeros((H, W, 3), dtype=np.uint8), layers))
     
     # 최종 병합
-    final = concatenate_videoclips(shots, method="compose")
-    final.write_videofile(
-        output_path,
-        fps=FPS, codec="libx264",
-        audio=True, audio_codec="aac",
-        ffmpeg_params=["-pix_fmt", "yuv420p", "-movflags", "faststart", "-g", str(FPS)],
+    encode_stills(frames, durations, audio_paths, output_path, FPS)
+    
+    logger.info(f"✅ 영상 저장: {output_path}")
+
+DURATION_RE = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+
+def probe_durations(paths: List[str]) -> List[float]:
+    """
+    미디어 파일들의 길이(초)를 ffmpeg 한 번으로 조회
+    
+    입력마다 출력하는 'Duration:' 줄을 순서대로 읽는다 (출력 파일이 없다는 오류로
+    끝나는 것은 정상).
+    """
+    cmd = [get_setting("FFMPEG_BINARY"), "-hide_banner"]
+    for path in paths:
+        cmd += ["-i", path]
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    found = DURATION_RE.findall(proc.stderr.decode(errors="replace"))
+    if len(found) != len(paths):
+        raise RuntimeError(f"음성 길이 조회 실패: {len(found)}/{len(paths)}개")
+    return [int(h) * 3600 + int(m) * 60 + float(sec) for h, m, sec in found]
+
+def _concat_list(paths: List[str], durations: Optional[List[float]] = None) -> str:
+    """ffmpeg concat demuxer 목록 (정지 프레임이면 파트 길이 지정)"""
+    def entry(path):
+        return "file '{}'".format(os.path.abspath(path).replace("'", "'\\''"))
+    
+    lines = ["ffconcat version 1.0"]
+    for i, path in enumerate(paths):
+        lines.append(entry(path))
+        if durations is not None:
+            lines.append(f"duration {durations[i]:.6f}")
+    if durations is not None and paths:
+        # 마지막 항목의 duration은 다음 파일이 있어야 적용됨
+        lines.append(entry(paths[-1]))
+    return "\n".join(lines) + "\n"
+
+def encode_stills(frames: List[np.ndarray], durations: List[float],
+                  audio_paths: List[str], output_path: str, fps: int):
+    """
+    파트별 정지 프레임 + 음성을 ffmpeg 한 번으로 인코딩
+    
+    프레임마다 레이어를 합성하는 MoviePy 대신, 합성이 끝난 정지 화면을 concat
+    demuxer로 파트 길이만큼 보여 주고 음성 파일들을 이어 붙여 함께 인코딩한다.
+    프레임은 모두 같은 크기(영상 해상도)로 합성되어 있어야 하며, 그래서 크기를
+    맞추는 scale/pad 필터 없이 그대로 이어 붙인다.
+    """
+    ffmpeg = get_setting("FFMPEG_BINARY")
+    with tempfile.TemporaryDirectory(prefix="shot_") as tmp:
+        shot_paths = []
+        for i, frame in enumerate(frames):
+            # 무압축 BMP: PNG 압축/해제 없이 바로 읽힘 (프레임당 수 MB, 임시 파일)
+            path = os.path.join(tmp, f"shot_{i}.bmp")
+            Image.fromarray(frame).save(path)
+            shot_paths.append(path)
+        
+        video_list = os.path.join(tmp, "video.txt")
+        audio_list = os.path.join(tmp, "audio.txt")
+        with open(video_list, "w", encoding="utf-8") as f:
+            f.write(_concat_list(shot_paths, durations))
+        with open(audio_list, "w", encoding="utf-8") as f:
+            f.write(_concat_list(audio_paths))
+        
+        cmd = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", video_list,
+            "-f", "concat", "-safe", "0", "-i", audio_list,
+            "-map", "0:v", "-map", "1:a",
+            # 파트 내내 화면이 같으므로 stillimage 튜닝 + 긴 키프레임 간격
+            "-c:v", "libx264", "-preset", Config.VIDEO_PRESET, "-tune", "stillimage",
+            "-threads", "0",
+            "-r", str(fps), "-pix_fmt", "yuv420p", "-g", str(fps * 10),
+            "-c:a", "aac", "-shortest",
+            "-movflags", "faststart",
+            output_path,
+        ]
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if proc.returncode != 0:
+            # 중간에 실패한 영상 파일이 남아 완성본처럼 보이지 않도록 삭제
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise RuntimeError(f"ffmpeg 인코딩 실패: {proc.stderr.decode(errors='replace')[-500:]}")
+
+def generate_video_for_article(art: Dict, art_idx: int = 1,
+                               top_text: Optional[str] = None) -> Dict:
+    """
+    단일 기사 영상 생성
+    
+    Args:
+        art: generate_tts() 반환값의 기사 1개
+        art_idx: 기사 번호 (파일명/로그용)
+        top_text: 공통 상단 자막 (옵션)
+    
+    Returns:
+        영상 경로가 추가된 기사
+    """
+    image_path = art.get("image_path")
+    summaries = art.get("summaries", [])
+    tts_files = art.get("tts_files", [])
+    
+    if not image_path or not summaries or not tts_files:
+        logger.info(f"  [{art_idx}] SKIP: 필수 데이터 없음")
+        art["video_path"] = None
+        return art
+    
+    if len(summaries) != len(tts_files):
+        logger.info(f"  [{art_idx}] SKIP: 요약과 TTS 개수 불일치")
+        art["video_path"] = None
+        return art
+    
+    logger.info(f"  [{art_idx}] {art.get('title', '')[:40]}...")
+    
+    # 이미지 분할
+    tiles = split_image_2x2(image_path)
+    
+    # 영상 생성
+    output_path = os.path.join(
+        Config.VIDEOS_DIR,
+        f"video_{art_idx:03d}_{art.get('news_id', 'unknown')}.mp4"
     )
     
-    print(f"✅ 영상 저장: {output_path}")
+    generate_video_from_parts(
+        image_tiles=tiles,
+        text_parts=summaries,
+        audio_paths=tts_files,
+        output_path=output_path,
+        top_text=top_text,
+        width=Config.VIDEO_WIDTH,
+        height=Config.VIDEO_HEIGHT,
+        fps=Config.VIDEO_FPS
+    )
+    
+    art["video_path"] = output_path
+    return art
 
 def generate_video(articles: List[Dict], top_text: Optional[str] = None) -> List[Dict]:
     """
@@ -295,46 +535,10 @@ def generate_video(articles: List[Dict], top_text: Optional[str] = None) -> List
     Returns:
         영상 경로가 추가된 기사 리스트
     """
-    print(f"\n🎬 영상 생성 시작...")
+    logger.info(f"\n🎬 영상 생성 시작...")
     
     for art_idx, art in enumerate(articles, 1):
-        image_path = art.get("image_path")
-        summaries = art.get("summaries", [])
-        tts_files = art.get("tts_files", [])
-        
-        if not image_path or not summaries or not tts_files:
-            print(f"  [{art_idx}] SKIP: 필수 데이터 없음")
-            art["video_path"] = None
-            continue
-        
-        if len(summaries) != len(tts_files):
-            print(f"  [{art_idx}] SKIP: 요약과 TTS 개수 불일치")
-            art["video_path"] = None
-            continue
-        
-        print(f"  [{art_idx}] {art.get('title', '')[:40]}...")
-        
-        # 이미지 분할
-        tiles = split_image_2x2(image_path)
-        
-        # 영상 생성
-        output_path = os.path.join(
-            Config.VIDEOS_DIR,
-            f"video_{art_idx:03d}_{art.get('news_id', 'unknown')}.mp4"
-        )
-        
-        generate_video_from_parts(
-            image_tiles=tiles,
-            text_parts=summaries,
-            audio_paths=tts_files,
-            output_path=output_path,
-            top_text=top_text,
-            width=Config.VIDEO_WIDTH,
-            height=Config.VIDEO_HEIGHT,
-            fps=Config.VIDEO_FPS
-        )
-        
-        art["video_path"] = output_path
+        generate_video_for_article(art, art_idx, top_text=top_text)
     
-    print(f"✅ 영상 생성 완료: {len(articles)}개 기사")
+    logger.info(f"✅ 영상 생성 완료: {len(articles)}개 기사")
     return articles
@@ -0,0 +1,47 @@
+"""
+video_gen 자막 렌더링 스모크 테스트
+
+    python -m unittest discover -s tests
+
+numpy/Pillow/moviepy가 없거나 자막 폰트를 찾지 못하면 건너뛴다.
+"""
+
+import os
+import sys
+import unittest
+from importlib.util import find_spec
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEPS = all(find_spec(name) for name in ("numpy", "PIL", "moviepy", "dotenv"))
+
+
+@unittest.skipUnless(DEPS, "numpy/Pillow/moviepy/python-dotenv 필요")
+class CaptionTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from modules import video_gen
+        cls.vg = video_gen
+
+    def test_tokenize(self):
+        toks = self.vg.CAPTION_TOKEN_RE.findall("한국 AI 3.5% 성장")
+        self.assertEqual(toks, ["한", "국", " ", "AI", " ", "3.5%", " ", "성", "장"])
+        # 결합 문자는 앞 글자 토큰에 붙는다 (か + 탁점, e + 양음 부호)
+        toks = self.vg.CAPTION_TOKEN_RE.findall("か\u3099 cafe\u0301")
+        self.assertEqual(toks, ["か\u3099", " ", "cafe\u0301"])
+
+    def test_render_caption(self):
+        from config import Config
+        if not os.path.exists(Config.FONT_PATH):
+            self.skipTest(f"자막 폰트 없음: {Config.FONT_PATH}")
+        img, meta = self.vg.render_caption_exact(
+            "한국 AI 3.5% 성장", 400, 200, Config.FONT_PATH, 32, return_meta=True
+        )
+        self.assertEqual(img.shape[1], 400)
+        self.assertEqual(img.shape[2], 4)
+        self.assertFalse(meta["overflow"])
+
+
+if __name__ == "__main__":
+    unittest.main()